@@ -5,6 +5,7 @@ This script will help us understand what data is available from the slicer.
 """
 
 import os
+import struct
 import subprocess
 import sys
 import tempfile
@@ -77,25 +78,7 @@ def test_orcaslicer_slice_export(model_path: str):
             # Inspect output directory
             print(f"\n=== Inspecting output directory: {output_dir} ===")
             if os.path.exists(output_dir):
-                for root, _dirs, files in os.walk(output_dir):
-                    level = root.replace(output_dir, "").count(os.sep)
-                    indent = " " * 2 * level
-                    print(f"{indent}{os.path.basename(root)}/")
-                    subindent = " " * 2 * (level + 1)
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        file_size = os.path.getsize(file_path)
-                        print(f"{subindent}{file} ({file_size} bytes)")
-
-                        # Try to read small files to understand content
-                        if file_size < 10000:  # Less than 10KB
-                            try:
-                                with open(file_path, encoding="utf-8") as f:
-                                    content = f.read()
-                                    print(f"{subindent}Content preview:")
-                                    print(f"{subindent}{content[:500]}...")
-                            except (UnicodeDecodeError, Exception):
-                                print(f"{subindent}Binary file or unreadable")
+                describe_output_tree(output_dir)
             else:
                 print("Output directory was not created!")
 
@@ -107,44 +90,81 @@ def test_orcaslicer_slice_export(model_path: str):
             print(f"OrcaSlicer CLI not found at {ORCASLICER_CLI}")
 
 
+def describe_output_tree(path: str, level: int = 0) -> None:
+    """Print a directory tree with file sizes and previews of small files.
+
+    Sizes come from the cached DirEntry stat, and each directory's listing
+    is written to stdout in one call.
+    """
+    indent = " " * 2 * level
+    subindent = " " * 2 * (level + 1)
+    lines = [f"{indent}{os.path.basename(path)}/"]
+    subdirs = []
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+
+            file_size = entry.stat().st_size
+            lines.append(f"{subindent}{entry.name} ({file_size} bytes)")
+
+            # Try to read small files to understand content
+            if file_size < 10000:  # Less than 10KB
+                try:
+                    with open(entry.path, encoding="utf-8") as f:
+                        content = f.read(500)
+                    lines.append(f"{subindent}Content preview:")
+                    lines.append(f"{subindent}{content}...")
+                except (UnicodeDecodeError, Exception):
+                    lines.append(f"{subindent}Binary file or unreadable")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    for subdir in subdirs:
+        describe_output_tree(subdir, level + 1)
+
+
 def create_test_stl() -> str:
     """Create a simple test STL file if none exists."""
     test_file = "test_cube.stl"
     if not os.path.exists(test_file):
-        # Create a simple ASCII STL cube (10x10x10mm)
-        stl_content = """solid cube
-  facet normal 0.0 0.0 -1.0
-    outer loop
-      vertex 0.0 0.0 0.0
-      vertex 10.0 0.0 0.0
-      vertex 10.0 10.0 0.0
-    endloop
-  endfacet
-  facet normal 0.0 0.0 -1.0
-    outer loop
-      vertex 0.0 0.0 0.0
-      vertex 10.0 10.0 0.0
-      vertex 0.0 10.0 0.0
-    endloop
-  endfacet
-  facet normal 0.0 0.0 1.0
-    outer loop
-      vertex 0.0 0.0 10.0
-      vertex 10.0 10.0 10.0
-      vertex 10.0 0.0 10.0
-    endloop
-  endfacet
-  facet normal 0.0 0.0 1.0
-    outer loop
-      vertex 0.0 0.0 10.0
-      vertex 0.0 10.0 10.0
-      vertex 10.0 10.0 10.0
-    endloop
-  endfacet
-endsolid cube"""
-
-        with open(test_file, "w") as f:
-            f.write(stl_content)
+        # Binary STL cube (10x10x10mm): 12 triangles, two per face
+        size = 10.0
+        corners = [
+            (x * size, y * size, z * size)
+            for z in (0, 1)
+            for y in (0, 1)
+            for x in (0, 1)
+        ]
+        # (normal, vertex indices) with counter-clockwise winding seen from outside
+        faces = [
+            ((0.0, 0.0, -1.0), (0, 2, 3)),
+            ((0.0, 0.0, -1.0), (0, 3, 1)),
+            ((0.0, 0.0, 1.0), (4, 5, 7)),
+            ((0.0, 0.0, 1.0), (4, 7, 6)),
+            ((0.0, -1.0, 0.0), (0, 1, 5)),
+            ((0.0, -1.0, 0.0), (0, 5, 4)),
+            ((0.0, 1.0, 0.0), (2, 6, 7)),
+            ((0.0, 1.0, 0.0), (2, 7, 3)),
+            ((-1.0, 0.0, 0.0), (0, 4, 6)),
+            ((-1.0, 0.0, 0.0), (0, 6, 2)),
+            ((1.0, 0.0, 0.0), (1, 3, 7)),
+            ((1.0, 0.0, 0.0), (1, 7, 5)),
+        ]
+
+        # 80-byte header (must not start with "solid"), triangle count, then
+        # per triangle: normal, three vertices and a zero attribute word
+        triangle = struct.Struct("<12fH")
+        data = bytearray(b"poc test cube".ljust(80, b"\0"))
+        data += struct.pack("<I", len(faces))
+        for normal, indices in faces:
+            vertices = [c for i in indices for c in corners[i]]
+            data += triangle.pack(*normal, *vertices, 0)
+
+        with open(test_file, "wb") as f:
+            f.write(data)
         print(f"Created test STL file: {test_file}")
 
     return test_file
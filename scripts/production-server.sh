@@ -23,5 +23,7 @@ uv run uvicorn orca_quote_machine.main:app \
     --host 0.0.0.0 \
     --port 8000 \
     --workers 4 \
+    --loop uvloop \
+    --http httptools \
     --log-level warning \
     --access-log
\ No newline at end of file
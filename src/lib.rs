@@ -9,7 +9,7 @@ use std::path::{Path, PathBuf};
 use std::time::{Duration, SystemTime};
 use thiserror::Error;
 use tokio::fs::File;
-use tokio::io::{AsyncBufReadExt, BufReader as AsyncBufReader};
+use tokio::io::{AsyncReadExt, AsyncSeekExt};
 
 #[derive(Error, Debug)]
 pub enum ValidationError {
@@ -315,14 +315,16 @@ pub struct CleanupStats {
     pub files_cleaned: u32,
     #[pyo3(get)]
     pub bytes_freed: u64,
+    #[pyo3(get)]
+    pub files_failed: u32,
 }
 
 #[pymethods]
 impl CleanupStats {
     fn __str__(&self) -> String {
         format!(
-            "CleanupStats(files={}, bytes={})",
-            self.files_cleaned, self.bytes_freed
+            "CleanupStats(files={}, bytes={}, failed={})",
+            self.files_cleaned, self.bytes_freed, self.files_failed
         )
     }
 }
@@ -365,47 +367,143 @@ impl CostBreakdown {
             self.material_type, self.total_cost
         )
     }
+
+    /// Multi-line cost summary for display, built without Python float formatting
+    fn format_summary(&self) -> String {
+        let (total_marker, minimum_note) = if self.minimum_applied {
+            ("*", "* Minimum price applied")
+        } else {
+            ("", "")
+        };
+        format!(
+            "Cost Breakdown:\n\
+             Material: {:.1}g ({:.3}kg) × S${:.2}/kg = S${:.2}\n\
+             Time: {:.1}h × S${:.2}/h = S${:.2}\n\
+             Subtotal: S${:.2} (includes {:.0}% markup)\n\
+             Total: S${:.2}{}\n\
+             {}",
+            self.filament_grams,
+            self.filament_kg,
+            self.price_per_kg,
+            self.material_cost,
+            self.print_time_hours,
+            self.price_per_kg,
+            self.time_cost,
+            self.subtotal,
+            self.markup_percentage,
+            self.total_cost,
+            total_marker,
+            minimum_note,
+        )
+    }
 }
 
 // Static regex definitions for performance
-static TIME_HOUR_REGEX: Lazy<Regex> = Lazy::new(|| Regex::new(r"(\d+)h").unwrap());
-static TIME_MINUTE_REGEX: Lazy<Regex> = Lazy::new(|| Regex::new(r"(\d+)m").unwrap());
-static TIME_MINUTE_ONLY_REGEX: Lazy<Regex> = Lazy::new(|| Regex::new(r"^(\d+)$").unwrap());
+static TIME_UNIT_REGEX: Lazy<Regex> = Lazy::new(|| Regex::new(r"(?i)(\d+)([hm])").unwrap());
 static FILAMENT_WEIGHT_REGEX: Lazy<Regex> = Lazy::new(|| Regex::new(r"(\d+\.?\d*)\s*g").unwrap());
 static LAYER_REGEX: Lazy<Regex> = Lazy::new(|| Regex::new(r"(\d+)").unwrap());
 
+/// Number of leading G-code lines scanned for metadata comments
+const GCODE_HEADER_LINES: usize = 200;
+/// Upper bound on bytes read from the G-code head; comfortably covers
+/// GCODE_HEADER_LINES even with embedded thumbnail lines
+const GCODE_HEAD_BYTES: u64 = 64 * 1024;
+/// Bytes read from the end of the G-code, where OrcaSlicer writes its totals
+const GCODE_TAIL_BYTES: u64 = 64 * 1024;
+
+/// Print metadata collected from G-code comments
+#[derive(Default)]
+struct GcodeMetadata {
+    print_time_minutes: u32,
+    filament_weight_grams: f32,
+    layer_count: Option<u32>,
+}
+
+impl GcodeMetadata {
+    fn is_complete(&self) -> bool {
+        self.print_time_minutes != 0
+            && self.filament_weight_grams != 0.0
+            && self.layer_count.is_some()
+    }
+
+    /// Scan up to `max_lines` lines of `text`; later matches override earlier ones
+    fn scan(&mut self, text: &str, max_lines: usize) {
+        // Lowercase the text once; ASCII lowercasing keeps byte offsets, so
+        // lines of both copies stay aligned and markers need no per-line alloc
+        let lower_text = text.to_ascii_lowercase();
+        
+        for (line, lower_line) in text.lines().zip(lower_text.lines()).take(max_lines) {
+            // Every metadata marker is a comment; skip move commands early
+            if !line.contains(';') {
+                continue;
+            }
+            
+            // Parse print time; header lines use ':' and footer totals use '='
+            if lower_line.contains("; estimated printing time") || lower_line.contains("; print time") {
+                if let Some(time_part) = line.split([':', '=']).last() {
+                    self.print_time_minutes = parse_time_string_to_minutes(time_part.trim());
+                }
+            }
+            // Parse filament usage
+            else if lower_line.contains("; filament used")
+                || lower_line.contains("; total filament used")
+                || lower_line.contains("; material volume")
+            {
+                if let Some(weight) = parse_filament_weight(line, lower_line) {
+                    self.filament_weight_grams = weight;
+                }
+            }
+            // Parse layer count
+            else if lower_line.contains("; layer_count") || lower_line.contains("; total layers") {
+                if let Some(cap) = LAYER_REGEX.captures(line) {
+                    self.layer_count = cap[1].parse::<u32>().ok();
+                }
+            }
+        }
+    }
+}
+
 /// Parse time string to minutes using Rust regex for performance
 fn parse_time_string_to_minutes(time_str: &str) -> u32 {
-    let clean_str = time_str.trim().to_lowercase();
-    let mut minutes = 0;
+    let clean_str = time_str.trim();
     
-    // Parse "1h 30m" format
-    if let Some(hour_cap) = TIME_HOUR_REGEX.captures(&clean_str) {
-        if let Ok(hours) = hour_cap[1].parse::<u32>() {
-            minutes += hours * 60;
-        }
+    // Bare minute counts such as "90" need no regex at all
+    if !clean_str.is_empty() && clean_str.bytes().all(|b| b.is_ascii_digit()) {
+        return match clean_str.parse::<u32>() {
+            Ok(mins) if mins > 0 => mins,
+            _ => 60,
+        };
     }
     
-    if let Some(min_cap) = TIME_MINUTE_REGEX.captures(&clean_str) {
-        if let Ok(mins) = min_cap[1].parse::<u32>() {
-            minutes += mins;
+    // Parse "1h 30m" format in a single pass; the first hour and minute values win
+    let mut hours: Option<u32> = None;
+    let mut mins: Option<u32> = None;
+    for cap in TIME_UNIT_REGEX.captures_iter(clean_str) {
+        let slot = if cap[2].eq_ignore_ascii_case("h") { &mut hours } else { &mut mins };
+        if slot.is_none() {
+            *slot = Some(cap[1].parse::<u32>().unwrap_or(0));
         }
-    }
-    
-    // Parse minutes-only format if no hours/minutes pattern found
-    if minutes == 0 {
-        if let Some(min_only_cap) = TIME_MINUTE_ONLY_REGEX.captures(&clean_str) {
-            if let Ok(mins) = min_only_cap[1].parse::<u32>() {
-                minutes = mins;
-            }
+        if hours.is_some() && mins.is_some() {
+            break;
         }
     }
     
+    let minutes = hours.unwrap_or(0) * 60 + mins.unwrap_or(0);
     if minutes == 0 { 60 } else { minutes } // Default to 1 hour if parsing fails
 }
 
 /// Parse filament weight from G-code comment using Rust regex
-fn parse_filament_weight(line: &str) -> Option<f32> {
+fn parse_filament_weight(line: &str, lower_line: &str) -> Option<f32> {
+    // OrcaSlicer footer totals read "; filament used [g] = 3.45", with one
+    // comma-separated value per extruder
+    if lower_line.contains("[g]") {
+        let (_, values) = line.split_once('=')?;
+        return values
+            .split(',')
+            .map(|value| value.trim().parse::<f32>().ok())
+            .sum();
+    }
+    
     if let Some(cap) = FILAMENT_WEIGHT_REGEX.captures(line) {
         cap[1].parse::<f32>().ok()
     } else {
@@ -433,42 +531,37 @@ fn parse_slicer_output(py: Python, output_dir: String) -> PyResult<&PyAny> {
             std::io::Error::new(std::io::ErrorKind::NotFound, "No .gcode file found")
         })?;
         
-        let file = File::open(gcode_path).await?;
-        let reader = AsyncBufReader::new(file);
-        let mut lines = reader.lines();
+        // Read the bounded head in one go instead of awaiting each line
+        let mut file = File::open(gcode_path).await?;
+        let mut head = Vec::with_capacity(GCODE_HEAD_BYTES as usize);
+        (&mut file).take(GCODE_HEAD_BYTES).read_to_end(&mut head).await?;
         
-        let mut print_time_minutes = 0u32;
-        let mut filament_weight_grams = 0.0f32;
-        let mut layer_count: Option<u32> = None;
+        // Scan the first 200 lines for metadata (increased from 100 for better coverage)
+        let mut metadata = GcodeMetadata::default();
+        metadata.scan(&String::from_utf8_lossy(&head), GCODE_HEADER_LINES);
         
-        // Read first 200 lines for metadata (increased from 100 for better coverage)
-        for _ in 0..200 {
-            if let Some(line) = lines.next_line().await? {
-                let lower_line = line.to_lowercase();
-                
-                // Parse print time
-                if lower_line.contains("; estimated printing time") || lower_line.contains("; print time") {
-                    if let Some(time_part) = line.split(':').last() {
-                        print_time_minutes = parse_time_string_to_minutes(time_part.trim());
-                    }
-                }
-                // Parse filament usage
-                else if lower_line.contains("; filament used") || lower_line.contains("; material volume") {
-                    if let Some(weight) = parse_filament_weight(&line) {
-                        filament_weight_grams = weight;
-                    }
-                }
-                // Parse layer count
-                else if lower_line.contains("; layer_count") || lower_line.contains("; total layers") {
-                    if let Some(cap) = LAYER_REGEX.captures(&line) {
-                        layer_count = cap[1].parse::<u32>().ok();
-                    }
-                }
-            } else {
-                break;
+        // OrcaSlicer writes its totals at the end of the file, so only read
+        // the tail when the head left something out
+        let file_len = file.metadata().await?.len();
+        if !metadata.is_complete() && file_len > GCODE_HEAD_BYTES {
+            let tail_start = file_len.saturating_sub(GCODE_TAIL_BYTES).max(GCODE_HEAD_BYTES);
+            file.seek(SeekFrom::Start(tail_start)).await?;
+            let mut tail = Vec::with_capacity(GCODE_TAIL_BYTES as usize);
+            file.take(GCODE_TAIL_BYTES).read_to_end(&mut tail).await?;
+            
+            // The first tail line is likely cut short by the seek, so skip it
+            let tail = String::from_utf8_lossy(&tail);
+            if let Some((_, complete_lines)) = tail.split_once('\n') {
+                metadata.scan(complete_lines, usize::MAX);
             }
         }
         
+        let GcodeMetadata {
+            mut print_time_minutes,
+            mut filament_weight_grams,
+            layer_count,
+        } = metadata;
+        
         // Set defaults if parsing failed
         if print_time_minutes == 0 {
             print_time_minutes = 60; // 1 hour default
@@ -532,41 +625,125 @@ fn calculate_quote_rust(
     })
 }
 
+/// Removing stale uploads is dominated by per-file unlink latency, so large
+/// batches are spread over a few threads
+const PARALLEL_CLEANUP_MIN_FILES: usize = 64;
+const MAX_CLEANUP_THREADS: usize = 8;
+
+/// Remove files in order, returning how many were removed, their total
+/// size and how many could not be removed.
+///
+/// Files already gone (NotFound) are skipped. Any other failure is counted
+/// and the file is left for the next run, so one failure never discards the
+/// removals already done in this or any other batch.
+fn remove_files(batch: &[(PathBuf, u64)]) -> (u32, u64, u32) {
+    let mut removed = (0u32, 0u64, 0u32);
+    for (path, len) in batch {
+        match fs::remove_file(path) {
+            Ok(()) => {
+                removed.0 += 1;
+                removed.1 += len;
+            }
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+            Err(_) => removed.2 += 1,
+        }
+    }
+    removed
+}
+
+/// Remove stale files, splitting large batches across scoped threads
+fn remove_stale_files(victims: &[(PathBuf, u64)]) -> (u32, u64, u32) {
+    if victims.len() < PARALLEL_CLEANUP_MIN_FILES {
+        return remove_files(victims);
+    }
+
+    let threads = std::thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .min(MAX_CLEANUP_THREADS);
+    let batch_size = victims.len().div_ceil(threads);
+
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = victims
+            .chunks(batch_size)
+            .map(|batch| (batch.len() as u32, scope.spawn(move || remove_files(batch))))
+            .collect();
+
+        // A panicked batch counts every file in it as failed; the others still add up
+        handles
+            .into_iter()
+            .map(|(len, handle)| handle.join().unwrap_or((0, 0, len)))
+            .fold((0u32, 0u64, 0u32), |total, (files, bytes, failed)| {
+                (total.0 + files, total.1 + bytes, total.2 + failed)
+            })
+    })
+}
+
 /// High-performance file cleanup in Rust
 #[pyfunction]
 fn cleanup_old_files_rust(upload_dir: String, max_age_hours: u64) -> PyResult<CleanupStats> {
     let dir = Path::new(&upload_dir);
-    let now = SystemTime::now();
-    let max_age = Duration::from_secs(max_age_hours * 3600);
+    let max_age = Duration::from_secs(max_age_hours.saturating_mul(3600));
     
     let mut stats = CleanupStats {
         files_cleaned: 0,
         bytes_freed: 0,
+        files_failed: 0,
+    };
+    
+    // Compare each mtime against one cutoff instead of computing an age per file
+    let cutoff = match SystemTime::now().checked_sub(max_age) {
+        Some(cutoff) => cutoff,
+        None => return Ok(stats),
     };
     
     if dir.is_dir() {
+        // Scan first, then delete, so removals can run in parallel
+        let mut victims: Vec<(PathBuf, u64)> = Vec::new();
         for entry in fs::read_dir(dir)? {
             let entry = entry?;
-            let path = entry.path();
-            if path.is_file() {
+            // The file type comes from the directory listing, so each file
+            // costs a single metadata call for both its mtime and size
+            if entry.file_type()?.is_file() {
                 let metadata = entry.metadata()?;
                 if let Ok(modified) = metadata.modified() {
-                    if now.duration_since(modified).unwrap_or_default() > max_age {
-                        stats.bytes_freed += metadata.len();
-                        fs::remove_file(path)?;
-                        stats.files_cleaned += 1;
+                    if modified < cutoff {
+                        victims.push((entry.path(), metadata.len()));
                     }
                 }
             }
         }
+        
+        let (files_cleaned, bytes_freed, files_failed) = remove_stale_files(&victims);
+        stats.files_cleaned = files_cleaned;
+        stats.bytes_freed = bytes_freed;
+        stats.files_failed = files_failed;
     }
     
     Ok(stats)
 }
 
+/// Check whether sanitize() would return the name unchanged.
+///
+/// Off Windows, sanitize-filename only strips illegal and control characters,
+/// rejects all-dot names and truncates to 255 bytes, so plain ASCII names can
+/// skip its regex passes entirely.
+fn is_already_safe_filename(filename: &str) -> bool {
+    !cfg!(windows)
+        && !filename.is_empty()
+        && filename.len() <= 255
+        && filename
+            .bytes()
+            .all(|b| b.is_ascii_alphanumeric() || matches!(b, b'.' | b'_' | b'-' | b' '))
+        && !filename.bytes().all(|b| b == b'.')
+}
+
 /// Sanitize a filename to remove characters that are not allowed by the OS.
 #[pyfunction]
 fn secure_filename(filename: String) -> PyResult<String> {
+    // Fast path: typical upload names are already safe
+    if is_already_safe_filename(&filename) {
+        return Ok(filename);
+    }
     Ok(sanitize(filename))
 }
 
@@ -592,4 +769,85 @@ fn _rust_core(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<CostBreakdown>()?;
     
     Ok(())
-}
\ No newline at end of file
+}
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn scan(text: &str) -> GcodeMetadata {
+        let mut metadata = GcodeMetadata::default();
+        metadata.scan(text, usize::MAX);
+        metadata
+    }
+
+    #[test]
+    fn filament_weight_sums_every_extruder() {
+        let line = "; filament used [g] = 1.25, 2.5, 0.00";
+        assert_eq!(parse_filament_weight(line, &line.to_ascii_lowercase()), Some(3.75));
+    }
+
+    #[test]
+    fn filament_weight_rejects_unparseable_extruder_values() {
+        let line = "; filament used [g] = 1.25, n/a";
+        assert_eq!(parse_filament_weight(line, &line.to_ascii_lowercase()), None);
+    }
+
+    #[test]
+    fn filament_weight_reads_header_grams() {
+        let line = "; filament used: 12.3g";
+        assert_eq!(parse_filament_weight(line, &line.to_ascii_lowercase()), Some(12.3));
+    }
+
+    #[test]
+    fn scan_reads_orcaslicer_footer() {
+        let metadata = scan(
+            "G1 X10 Y10 E0.05\n\
+             ; filament used [mm] = 1150.42, 300.00\n\
+             ; filament used [cm3] = 2.77, 0.72\n\
+             ; filament used [g] = 3.45, 0.90\n\
+             ; filament cost = 0.08, 0.02\n\
+             ; total filament used [g] = 4.35\n\
+             ; total layers count = 54\n\
+             ; estimated printing time (normal mode) = 1h 2m 3s\n",
+        );
+
+        assert_eq!(metadata.print_time_minutes, 62);
+        assert_eq!(metadata.filament_weight_grams, 4.35);
+        assert_eq!(metadata.layer_count, Some(54));
+        assert!(metadata.is_complete());
+    }
+
+    #[test]
+    fn scan_ignores_lines_without_markers() {
+        let metadata = scan("G1 X10 Y10 E0.05\n; layer height = 0.2\n");
+
+        assert!(!metadata.is_complete());
+        assert_eq!(metadata.layer_count, None);
+    }
+
+    #[test]
+    fn remove_files_skips_missing_and_counts_failures() {
+        let dir = std::env::temp_dir().join(format!("rust_core_cleanup_{}", std::process::id()));
+        fs::create_dir_all(dir.join("subdir")).unwrap();
+        fs::write(dir.join("stale.stl"), b"solid").unwrap();
+
+        let batch = vec![
+            (dir.join("stale.stl"), 5),
+            (dir.join("already_gone.stl"), 7),
+            // remove_file refuses directories, standing in for a permission error
+            (dir.join("subdir"), 0),
+        ];
+        let removed = remove_files(&batch);
+        fs::remove_dir_all(&dir).unwrap();
+
+        assert_eq!(removed, (1, 5, 1));
+    }
+
+    #[test]
+    fn scan_keeps_header_values_in_colon_form() {
+        let metadata = scan("; estimated printing time: 1h 30m\n; layer_count: 120\n");
+
+        assert_eq!(metadata.print_time_minutes, 90);
+        assert_eq!(metadata.layer_count, Some(120));
+    }
+}
@@ -1,12 +1,40 @@
 """Application configuration settings."""
 
 import os
-from functools import lru_cache
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Default material pricing (per kg), shared read-only across Settings instances
+_DEFAULT_MATERIAL_PRICES: Mapping[str, float] = MappingProxyType(
+    {
+        "PLA": 25.0,
+        "PETG": 30.0,
+        "ASA": 35.0,
+    }
+)
+
+_PROFILE_TYPES = ("machine", "process", "filament")
+
+# Profile directory mtimes seen at the last successful validation, keyed by
+# base_dir plus the configured profile names
+_validated_profile_dirs: dict[tuple[str, ...], tuple[int, ...]] = {}
+
+
+def _profile_dir_mtimes(base_dir: Path) -> tuple[int, ...] | None:
+    """Return the mtimes of the profile directories, or None if any is missing."""
+    try:
+        return tuple(
+            os.stat(base_dir / profile_type).st_mtime_ns
+            for profile_type in _PROFILE_TYPES
+        )
+    except OSError:
+        return None
+
 
 class SlicerProfileSettings(BaseModel):
     """Configuration for default slicer profiles."""
@@ -40,12 +68,39 @@ class SlicerProfileSettings(BaseModel):
             ("filament", self.filament_petg),
             ("filament", self.filament_asa),
         ]
+        # Adding, removing or renaming a profile bumps its directory mtime,
+        # so unchanged directories do not need to be listed again
+        cache_key = (str(self.base_dir), *(name for _, name in profiles_to_check))
+        dir_mtimes = _profile_dir_mtimes(self.base_dir)
+        if (
+            dir_mtimes is not None
+            and _validated_profile_dirs.get(cache_key) == dir_mtimes
+        ):
+            return self
+
+        # List each profile directory once instead of stat-ing every file
+        available: dict[str, frozenset[str]] = {}
         for profile_type, filename in profiles_to_check:
-            profile_path = self.base_dir / profile_type / filename
-            if not profile_path.exists():
+            profile_dir = self.base_dir / profile_type
+            if profile_type not in available:
+                try:
+                    with os.scandir(profile_dir) as entries:
+                        available[profile_type] = frozenset(e.name for e in entries)
+                except OSError:
+                    raise ValueError(
+                        f"{profile_type.capitalize()} profile not found: "
+                        f"directory {profile_dir} does not exist"
+                    ) from None
+
+            profile_path = profile_dir / filename
+            # Fall back to a stat for nested or case-insensitive names
+            if filename not in available[profile_type] and not profile_path.exists():
                 raise ValueError(
                     f"{profile_type.capitalize()} profile not found at: {profile_path}"
                 )
+
+        if dir_mtimes is not None:
+            _validated_profile_dirs[cache_key] = dir_mtimes
         return self
 
 
@@ -79,11 +134,9 @@ class Settings(BaseSettings):
     additional_time_hours: float = 0.5  # Add 30 minutes to print time
 
     # Material pricing (per kg)
-    material_prices: dict = {
-        "PLA": 25.0,
-        "PETG": 30.0,
-        "ASA": 35.0,
-    }
+    material_prices: dict[str, float] = Field(
+        default_factory=lambda: dict(_DEFAULT_MATERIAL_PRICES)
+    )
 
     # Redis/Celery settings
     redis_url: str = "redis://localhost:6379/0"
@@ -129,6 +182,11 @@ class Settings(BaseSettings):
             for ext in extensions
         ]
 
+    @cached_property
+    def allowed_extensions_set(self) -> frozenset[str]:
+        """Normalized allowed extensions as a set for O(1) membership tests."""
+        return frozenset(self.allowed_extensions)
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -2,7 +2,7 @@
 
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from orca_quote_machine.core.config import Settings, get_settings
 from orca_quote_machine.services.pricing import PricingService
@@ -11,21 +11,31 @@ from orca_quote_machine.services.telegram import TelegramService
 
 
 def get_slicer_service(
-    settings: Annotated[Settings, Depends(get_settings)]
+    request: Request, settings: Annotated[Settings, Depends(get_settings)]
 ) -> OrcaSlicerService:
-    """Get OrcaSlicerService instance."""
-    return OrcaSlicerService(settings=settings)
+    """Get the app-wide OrcaSlicerService instance.
+
+    The instance is normally created by the app lifespan; it is created lazily
+    here when the app was started without one (e.g. a bare TestClient).
+    """
+    slicer_service: OrcaSlicerService | None = getattr(
+        request.app.state, "slicer", None
+    )
+    if slicer_service is None:
+        slicer_service = OrcaSlicerService(settings=settings)
+        request.app.state.slicer = slicer_service
+    return slicer_service
 
 
 def get_pricing_service(
-    settings: Annotated[Settings, Depends(get_settings)]
+    settings: Annotated[Settings, Depends(get_settings)],
 ) -> PricingService:
     """Get PricingService instance."""
     return PricingService(settings=settings)
 
 
 def get_telegram_service(
-    settings: Annotated[Settings, Depends(get_settings)]
+    settings: Annotated[Settings, Depends(get_settings)],
 ) -> TelegramService:
     """Get TelegramService instance."""
     return TelegramService(settings=settings)
@@ -2,12 +2,14 @@
 
 import contextlib
 import os
-import uuid
+import secrets
+import sys
+from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, BinaryIO
 
-import aiofiles
 import aiofiles.os
+import orjson
 from fastapi import (
     Depends,
     FastAPI,
@@ -18,26 +20,80 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from orca_quote_machine._rust_core import secure_filename
 from orca_quote_machine.core.config import get_settings
 from orca_quote_machine.dependencies import get_slicer_service
-from orca_quote_machine.models.quote import MaterialType, QuoteRequest
+from orca_quote_machine.models.quote import MATERIAL_BY_NAME, QuoteRequest
 from orca_quote_machine.services.slicer import OrcaSlicerService
 from orca_quote_machine.tasks import celery_app, process_quote_request
 
 settings = get_settings()
 
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create app-lifetime services once at startup."""
+    app.state.slicer = OrcaSlicerService(settings=settings)
+    yield
+
+
+# Allowance for the form fields and multipart framing around the model file
+_FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Reject quote uploads whose declared Content-Length is already too large.
+
+    FastAPI reads the whole multipart body before create_quote runs, so this
+    is the only place an oversize upload can be refused before it is spooled.
+    Chunked uploads have no Content-Length and fall through to the size
+    checks in create_quote.
+    """
+
+    def __init__(self, app: ASGIApp, path: str, max_body_size: int) -> None:
+        self.app = app
+        self.path = path
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and scope["path"] == self.path
+        ):
+            for key, value in scope["headers"]:
+                if key == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        response = ORJSONResponse(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            content={"detail": _file_too_large().detail},
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.app_name,
     description="Generate 3D printing quotations using OrcaSlicer",
     version="0.1.0",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path="/quote",
+    max_body_size=settings.max_file_size + _FORM_OVERHEAD_BYTES,
 )
 
 # Mount static files and templates
@@ -46,8 +102,104 @@ if not os.getenv("PYTEST_CURRENT_TEST"):
     app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
+# Resolve the upload directory and extension set once, not per request
+UPLOAD_DIR = Path(settings.upload_dir)
+ALLOWED_EXT_SET = settings.allowed_extensions_set
+_ALLOWED_EXT_JOINED = ", ".join(settings.allowed_extensions)
+
 # Ensure upload directory exists
-Path(settings.upload_dir).mkdir(exist_ok=True)
+UPLOAD_DIR.mkdir(exist_ok=True)
+
+# Static /health payload, hit every few seconds by liveness probes
+_HEALTH_BODY = orjson.dumps(
+    {"status": "healthy", "app_name": settings.app_name, "version": "0.1.0"}
+)
+
+# Uploads are copied in 1 MiB chunks
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Listed in the error for an unknown material
+_MATERIAL_NAMES_JOINED = ", ".join(MATERIAL_BY_NAME)
+
+
+# Only Linux sendfile() copies file to file; macOS and the BSDs need a socket
+_SENDFILE_FILE_TO_FILE = sys.platform.startswith("linux")
+
+
+def _is_spooled_to_disk(upload: BinaryIO) -> bool:
+    """Check whether Starlette has rolled an upload over to a real temp file.
+
+    SpooledTemporaryFile has no public flag for this; without ``_rolled`` the
+    upload simply takes the buffered copy.
+    """
+    return _SENDFILE_FILE_TO_FILE and getattr(upload, "_rolled", False)
+
+
+def _sendfile_upload(upload: BinaryIO, dest: Path, limit: int) -> int:
+    """Copy a disk-backed upload to dest in-kernel, stopping after limit bytes.
+
+    Returns the number of bytes written.
+    """
+    written = 0
+    with open(dest, "wb") as out:
+        while written < limit:
+            sent = os.sendfile(out.fileno(), upload.fileno(), None, limit - written)
+            if sent == 0:
+                break
+            written += sent
+    return written
+
+
+def _copy_upload(upload: BinaryIO, dest: Path, limit: int) -> int:
+    """Copy an upload to dest in buffered chunks, stopping after limit bytes.
+
+    Returns the number of bytes written.
+    """
+    written = 0
+    with open(dest, "wb") as out:
+        while written < limit:
+            chunk = upload.read(min(UPLOAD_CHUNK_SIZE, limit - written))
+            if not chunk:
+                break
+            out.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def _save_upload(upload: BinaryIO, dest: Path, max_bytes: int) -> int:
+    """Save an upload to dest in one blocking call, for use in the threadpool.
+
+    Disk-backed spools are copied in-kernel where the platform allows it;
+    everything else takes a buffered copy. Copying stops just past
+    max_bytes, so a return value above it means the upload was too large.
+    """
+    upload.seek(0)
+    if _is_spooled_to_disk(upload):
+        try:
+            return _sendfile_upload(upload, dest, max_bytes + 1)
+        except OSError:
+            # e.g. EINVAL or ENOSYS where the filesystem lacks sendfile support;
+            # the buffered copy rewrites dest from the start
+            upload.seek(0)
+
+    return _copy_upload(upload, dest, max_bytes + 1)
+
+
+def _file_too_large() -> HTTPException:
+    """Build the 413 error for uploads over the configured size limit."""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File too large. Maximum size: {settings.max_file_size // (1024 * 1024)}MB",
+    )
+
+
+async def _safe_unlink(path: Path) -> None:
+    """Remove a partially handled upload, ignoring a file that is already gone.
+
+    Other OS errors are swallowed too so cleanup never masks the original error.
+    """
+    with contextlib.suppress(OSError):
+        await aiofiles.os.remove(path)
 
 
 
@@ -62,7 +214,7 @@ async def home(
         available_materials = slicer_service.get_available_materials()
     except Exception:
         # Fallback to enum values if slicer service fails
-        available_materials = [material.value for material in MaterialType]
+        available_materials = list(MATERIAL_BY_NAME)
 
     return templates.TemplateResponse(
         "index.html",
@@ -70,7 +222,7 @@ async def home(
             "request": request,
             "materials": available_materials,
             "max_file_size_mb": settings.max_file_size // (1024 * 1024),
-            "allowed_extensions": ", ".join(settings.allowed_extensions),
+            "allowed_extensions": _ALLOWED_EXT_JOINED,
         },
     )
 
@@ -83,7 +235,7 @@ async def create_quote(
     material: str | None = Form(None),
     color: str | None = Form(None, max_length=50),
     model_file: UploadFile = File(...),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a new quote request.
 
@@ -97,29 +249,41 @@ async def create_quote(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
         )
 
-    file_ext = Path(model_file.filename).suffix.lower()
-    if file_ext not in settings.allowed_extensions:
+    # Slice the suffix directly rather than building a PurePath per request;
+    # a leading dot alone is a hidden name, not an extension, as with Path.suffix
+    filename = model_file.filename
+    dot = filename.rfind(".")
+    file_ext = filename[dot:].lower() if dot > 0 else ""
+    if file_ext not in ALLOWED_EXT_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type {file_ext} not allowed. Supported: {', '.join(settings.allowed_extensions)}",
+            detail=f"File type {file_ext} not allowed. Supported: {_ALLOWED_EXT_JOINED}",
         )
 
-    # Validate material against available materials (including custom ones)
-    if material:
+    # Reject oversize uploads before touching the upload directory. Starlette
+    # has already spooled the file, so its size is known up front.
+    max_file_size = settings.max_file_size
+    if model_file.size is not None and model_file.size > max_file_size:
+        raise _file_too_large()
+
+    # Official materials are always available; only custom ones need a
+    # lookup against the discovered filament profiles
+    material_key = material.upper() if material else None
+    material_enum = MATERIAL_BY_NAME.get(material_key) if material_key else None
+    if material_key and material_enum is None:
         try:
             available_materials = slicer_service.get_available_materials()
-            if material.upper() not in available_materials:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid material. Supported: {', '.join(available_materials)}",
-                )
         except Exception:
             # Fallback to enum validation if slicer service fails
-            if material.upper() not in [m.value for m in MaterialType]:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid material. Supported: {', '.join([m.value for m in MaterialType])}",
-                ) from None
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid material. Supported: {_MATERIAL_NAMES_JOINED}",
+            ) from None
+        if material_key not in available_materials:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid material. Supported: {', '.join(available_materials)}",
+            )
 
     # Sanitize filename to prevent path traversal
     safe_filename = secure_filename(model_file.filename)
@@ -133,7 +297,9 @@ async def create_quote(
         quote_request = QuoteRequest(
             name=name,
             mobile=mobile,
-            material=MaterialType(material.upper()) if material else None,
+            # Custom materials have no enum member; the task passes their name on
+            # to the slicer and pricing
+            material=material_enum,
             color=color,
             filename=safe_filename,
         )
@@ -142,32 +308,25 @@ async def create_quote(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         ) from e
 
-    # Save uploaded file with size validation during write
-    file_id = str(uuid.uuid4())
-    file_path = Path(settings.upload_dir) / f"{file_id}_{safe_filename}"
+    # Save uploaded file, re-checking its size as it is copied
+    # Random prefix only needs to keep concurrent uploads apart on disk
+    file_id = secrets.token_hex(8)
+    file_path = UPLOAD_DIR / f"{file_id}_{safe_filename}"
 
-    written_bytes = 0
     try:
-        async with aiofiles.open(file_path, "wb") as f:
-            while chunk := await model_file.read(8192):  # Read in 8KB chunks
-                written_bytes += len(chunk)
-                if written_bytes > settings.max_file_size:
-                    # Clean up partial file
-                    await f.close()
-                    if file_path.exists():
-                        await aiofiles.os.remove(file_path)
-                    raise HTTPException(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        detail=f"File too large. Maximum size: {settings.max_file_size // (1024 * 1024)}MB",
-                    )
-                await f.write(chunk)
+        # One threadpool hop per upload instead of an awaited write per chunk
+        written_bytes = await run_in_threadpool(
+            _save_upload, model_file.file, file_path, max_file_size
+        )
+        # Defense in depth in case the declared size was missing
+        if written_bytes > max_file_size:
+            await _safe_unlink(file_path)
+            raise _file_too_large()
     except HTTPException:
         raise  # Re-raise HTTP exceptions
     except OSError as e:
-        # Clean up file if it exists
-        if file_path.exists():
-            with contextlib.suppress(OSError):
-                await aiofiles.os.remove(file_path)
+        # Clean up any partially written file
+        await _safe_unlink(file_path)
 
         # Provide specific error messages for common I/O errors
         if e.errno == 28:  # ENOSPC - No space left on device
@@ -183,9 +342,7 @@ async def create_quote(
         ) from e
     except Exception as e:
         # Handle any other unexpected errors
-        if file_path.exists():
-            with contextlib.suppress(OSError):
-                await aiofiles.os.remove(file_path)
+        await _safe_unlink(file_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error while saving file: {type(e).__name__}",
@@ -199,7 +356,7 @@ async def create_quote(
             material=material,
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_202_ACCEPTED,
             content={
                 "message": "Quote request received and is being processed",
@@ -213,8 +370,7 @@ async def create_quote(
 
     except (ConnectionError, TimeoutError) as e:
         # Cleanup file if task creation fails due to connection issues
-        with contextlib.suppress(OSError):
-            await aiofiles.os.remove(file_path)
+        await _safe_unlink(file_path)
 
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -222,8 +378,7 @@ async def create_quote(
         ) from e
     except Exception as e:
         # Cleanup file if task creation fails for other reasons
-        with contextlib.suppress(OSError):
-            await aiofiles.os.remove(file_path)
+        await _safe_unlink(file_path)
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -232,9 +387,10 @@ async def create_quote(
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "app_name": settings.app_name, "version": "0.1.0"}
+    # Body never changes, so it is serialized once at import
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/status/{task_id}")
@@ -264,6 +420,13 @@ async def get_task_status(task_id: str) -> dict[str, Any]:
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop and httptools come with uvicorn[standard]; name them explicitly so a
+    # missing install fails loudly instead of falling back to asyncio and h11.
     uvicorn.run(
-        "orca_quote_machine.main:app", host=settings.host, port=settings.port, reload=settings.debug
+        "orca_quote_machine.main:app",
+        host=settings.host,
+        port=settings.port,
+        reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
     )
@@ -4,7 +4,12 @@ import re
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field, computed_field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+
+# Validator patterns compiled once at import instead of per request
+_MOBILE_SEPARATORS_RE = re.compile(r"[\s\-\(\)\.]+")
+_MOBILE_RE = re.compile(r"^\+?[\d]{8,15}$")
+_NAME_INVALID_CHARS_RE = re.compile(r"[\d@#$%^&*()+=\[\]{}|\\:;\"<>?/~`]")
 
 
 class MaterialType(str, Enum):
@@ -15,6 +20,10 @@ class MaterialType(str, Enum):
     ASA = "ASA"
 
 
+# Official materials by name; any other name is a custom filament profile
+MATERIAL_BY_NAME: dict[str, MaterialType] = {m.value: m for m in MaterialType}
+
+
 class QuoteStatus(str, Enum):
     """Quote request status."""
 
@@ -27,6 +36,9 @@ class QuoteStatus(str, Enum):
 class QuoteRequest(BaseModel):
     """Quote request from user."""
 
+    # Immutable once validated, so a request can be hashed and used as a cache key
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=1, max_length=100)
     mobile: str = Field(..., min_length=8, max_length=20)
     material: MaterialType | None = None
@@ -38,10 +50,10 @@ class QuoteRequest(BaseModel):
     def validate_mobile(cls: type["QuoteRequest"], v: str) -> str:
         """Validate mobile number format."""
         # Remove spaces and common separators
-        clean_mobile = re.sub(r"[\s\-\(\)\.]+", "", v)
+        clean_mobile = _MOBILE_SEPARATORS_RE.sub("", v)
 
         # Check if it's a valid phone number (basic validation)
-        if not re.match(r"^\+?[\d]{8,15}$", clean_mobile):
+        if not _MOBILE_RE.match(clean_mobile):
             raise ValueError("Invalid mobile number format")
 
         return clean_mobile
@@ -57,7 +69,7 @@ class QuoteRequest(BaseModel):
 
         # Reject names with numbers or most special characters
         # Allow letters (including Unicode), spaces, hyphens, dots, apostrophes
-        if re.search(r"[\d@#$%^&*()+=\[\]{}|\\:;\"<>?/~`]", stripped):
+        if _NAME_INVALID_CHARS_RE.search(stripped):
             raise ValueError("Name contains invalid characters")
         return stripped
 
@@ -1,5 +1,7 @@
 """Pricing calculation service."""
 
+from functools import lru_cache
+
 from orca_quote_machine._rust_core import (
     CostBreakdown,
     SlicingResult,
@@ -9,16 +11,49 @@ from orca_quote_machine.core.config import Settings, get_settings
 from orca_quote_machine.models.quote import MaterialType
 
 
+@lru_cache(maxsize=1024)
+def _calculate_quote_cached(
+    print_time_minutes: int,
+    filament_weight_grams: float,
+    material_type: str,
+    price_per_kg: float,
+    additional_time_hours: float,
+    price_multiplier: float,
+    minimum_price: float,
+) -> CostBreakdown:
+    """Memoized pricing calculation.
+
+    Every pricing parameter is part of the cache key, so changed settings
+    never return a stale breakdown. CostBreakdown is read-only and safe to share.
+    """
+    return calculate_quote_rust(
+        print_time_minutes,
+        filament_weight_grams,
+        material_type,
+        price_per_kg,
+        additional_time_hours,
+        price_multiplier,
+        minimum_price,
+    )
+
+
 class PricingService:
     """Service for calculating print costs."""
 
     def __init__(self: "PricingService", settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
 
+        # Bind pricing parameters once so each quote is plain attribute reads
+        self._price_for = dict(self.settings.material_prices).get
+        self._default_price_per_kg = self.settings.default_price_per_kg
+        self._additional_time_hours = self.settings.additional_time_hours
+        self._price_multiplier = self.settings.price_multiplier
+        self._minimum_price = self.settings.minimum_price
+
     def calculate_quote(
         self: "PricingService",
         slicing_result: SlicingResult,
-        material: MaterialType | None = None,
+        material: MaterialType | str | None = None,
     ) -> CostBreakdown:
         """
         Calculate pricing for a 3D print job using high-performance Rust implementation.
@@ -28,47 +63,30 @@ class PricingService:
 
         Args:
             slicing_result: Results from slicing operation
-            material: Material type used
+            material: Material type or custom material name used
 
         Returns:
             CostBreakdown object with pricing details
         """
-        material = material or MaterialType.PLA
+        material_name = getattr(material, "value", material) or MaterialType.PLA.value
 
-        # Get material price per kg
-        price_per_kg = self.settings.material_prices.get(
-            material.value, self.settings.default_price_per_kg
-        )
+        # Get material price per kg; custom materials use the default price
+        price_per_kg = self._price_for(material_name, self._default_price_per_kg)
 
-        # Use Rust implementation for enhanced performance
-        return calculate_quote_rust(
+        # Use Rust implementation for enhanced performance, memoized for repeat jobs
+        return _calculate_quote_cached(
             slicing_result.print_time_minutes,
             slicing_result.filament_weight_grams,
-            material.value,
+            material_name,
             price_per_kg,
-            self.settings.additional_time_hours,
-            self.settings.price_multiplier,
-            self.settings.minimum_price,
+            self._additional_time_hours,
+            self._price_multiplier,
+            self._minimum_price,
         )
 
     def format_cost_summary(
         self: "PricingService", cost_breakdown: CostBreakdown
     ) -> str:
         """Format cost breakdown for display."""
-        material_line = (
-            f"Material: {cost_breakdown.filament_grams:.1f}g "
-            f"({cost_breakdown.filament_kg:.3f}kg) × "
-            f"S${cost_breakdown.price_per_kg:.2f}/kg = "
-            f"S${cost_breakdown.material_cost:.2f}"
-        )
-        time_line = (
-            f"Time: {cost_breakdown.print_time_hours:.1f}h × "
-            f"S${cost_breakdown.price_per_kg:.2f}/h = "
-            f"S${cost_breakdown.time_cost:.2f}"
-        )
-        return f"""Cost Breakdown:
-{material_line}
-{time_line}
-Subtotal: S${cost_breakdown.subtotal:.2f} (includes {cost_breakdown.markup_percentage:.0f}% markup)
-Total: S${cost_breakdown.total_cost:.2f}{"*" if cost_breakdown.minimum_applied else ""}
-{"* Minimum price applied" if cost_breakdown.minimum_applied else ""}"""
+        # Built in Rust from the breakdown's own fields, in one boundary crossing
+        return cost_breakdown.format_summary()  # type: ignore[no-any-return]
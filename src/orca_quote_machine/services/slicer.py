@@ -1,14 +1,29 @@
 """OrcaSlicer integration service."""
 
 import asyncio
+import contextlib
 import os
+import shutil
 import tempfile
+from collections import deque
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 # Import enhanced Rust functions
 from orca_quote_machine._rust_core import SlicingResult, parse_slicer_output
 from orca_quote_machine.core.config import Settings, get_settings
-from orca_quote_machine.models.quote import MaterialType
+from orca_quote_machine.models.quote import MATERIAL_BY_NAME, MaterialType
+
+# Slicer stderr is read in chunks and only the most recent ones are kept,
+# bounding memory to about 1 MiB however verbose the slicer is
+_PIPE_READ_SIZE = 64 * 1024
+_PIPE_TAIL_CHUNKS = 16
+
+
+async def _drain_tail(stream: asyncio.StreamReader, tail: deque[bytes]) -> None:
+    """Read a pipe to EOF, keeping only the chunks that fit in ``tail``."""
+    while chunk := await stream.read(_PIPE_READ_SIZE):
+        tail.append(chunk)
 
 
 class SlicerError(Exception):
@@ -17,6 +32,23 @@ class SlicerError(Exception):
     pass
 
 
+def _make_scratch_dir() -> str:
+    """Create a scratch directory with an empty ``output`` subdirectory."""
+    temp_dir = tempfile.mkdtemp()
+    os.mkdir(os.path.join(temp_dir, "output"))
+    return temp_dir
+
+
+@contextlib.asynccontextmanager
+async def _scratch_dir() -> AsyncIterator[str]:
+    """Temporary slicer working directory, created and removed off the event loop."""
+    temp_dir = await asyncio.to_thread(_make_scratch_dir)
+    try:
+        yield temp_dir
+    finally:
+        await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+
+
 class OrcaSlicerService:
     """Service for interacting with OrcaSlicer CLI."""
 
@@ -26,6 +58,39 @@ class OrcaSlicerService:
         self.profiles_dir = self.settings.slicer_profiles.base_dir  # type: ignore[union-attr]
         self.filament_profiles_dir = self.profiles_dir / "filament"
 
+        # Machine and process profiles never vary per request; resolve them once
+        profile_config = self.settings.slicer_profiles
+        self._machine_path = str(
+            (self.profiles_dir / "machine" / profile_config.machine).resolve()  # type: ignore[union-attr]
+        )
+        self._process_path = str(
+            (self.profiles_dir / "process" / profile_config.process).resolve()  # type: ignore[union-attr]
+        )
+        # Per material: resolved profile paths and the --load-settings and
+        # --load-filaments CLI values, dropped when the filament profile
+        # directory mtime changes
+        self._profile_paths_cache: dict[str, dict[str, str]] = {}
+        self._slicer_args_cache: dict[str, tuple[str, str]] = {}
+        self._profile_caches_mtime: int | None = None
+
+        # Discovered materials keyed by filament profile directory mtime
+        self._materials_cache: tuple[int | None, tuple[str, ...]] | None = None
+
+    def _get_profiles_mtime(self) -> int | None:
+        """Return the filament profile directory mtime, or None if it is missing."""
+        try:
+            return os.stat(self.filament_profiles_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_profile_caches(self) -> None:
+        """Drop cached profile paths once a filament profile is added, removed or renamed."""
+        profiles_mtime = self._get_profiles_mtime()
+        if profiles_mtime != self._profile_caches_mtime:
+            self._profile_paths_cache.clear()
+            self._slicer_args_cache.clear()
+            self._profile_caches_mtime = profiles_mtime
+
     def _get_filament_profile_path(self, material_name: str) -> Path:
         """
         Gets the path to a filament profile using a hybrid strategy.
@@ -67,47 +132,84 @@ class OrcaSlicerService:
         # Default to PLA if no material is provided.
         material_name = getattr(material, "value", material) or MaterialType.PLA.value
 
-        profile_config = self.settings.slicer_profiles
-        filament_profile_path = self._get_filament_profile_path(material_name)
+        self._refresh_profile_caches()
+        cached = self._profile_paths_cache.get(material_name)
+        if cached is None:
+            filament_profile_path = self._get_filament_profile_path(material_name)
+            cached = {
+                "machine": self._machine_path,
+                "filament": str(filament_profile_path.resolve()),
+                "process": self._process_path,
+            }
+            self._profile_paths_cache[material_name] = cached
 
-        profiles = {
-            "machine": self.profiles_dir / "machine" / profile_config.machine,  # type: ignore[union-attr]
-            "filament": filament_profile_path,
-            "process": self.profiles_dir / "process" / profile_config.process,  # type: ignore[union-attr]
-        }
+        # Hand out a copy so callers cannot corrupt the cached entry
+        return dict(cached)
 
-        return {k: str(v.resolve()) for k, v in profiles.items()}
+    def _get_slicer_profile_args(
+        self, material: MaterialType | str | None
+    ) -> tuple[str, str]:
+        """Return the --load-settings and --load-filaments values for a material."""
+        material_name = getattr(material, "value", material) or MaterialType.PLA.value
+
+        self._refresh_profile_caches()
+        args = self._slicer_args_cache.get(material_name)
+        if args is None:
+            profiles = self.get_profile_paths(material_name)
+            args = (
+                f"{profiles['machine']};{profiles['process']}",
+                profiles["filament"],
+            )
+            self._slicer_args_cache[material_name] = args
+        return args
 
     def get_available_materials(self) -> list[str]:
         """
         Discovers all available materials for populating UI elements.
         Combines official materials from the enum with custom materials
         found as .json files in the filament profile directory.
+
+        Adding, removing or renaming a profile updates the directory mtime,
+        so the directory is only rescanned when that changes.
         """
-        # 1. Start with official materials from the enum
-        official_materials = {m.value for m in MaterialType}
+        profiles_mtime = self._get_profiles_mtime()
+
+        cache = self._materials_cache
+        if cache is not None and cache[0] == profiles_mtime:
+            return list(cache[1])
 
-        # 2. Scan the filesystem for all .json files
+        # 1. Scan the filesystem for all .json files
         discovered_materials = set()
-        if self.filament_profiles_dir.is_dir():
-            for f in self.filament_profiles_dir.glob("*.json"):
-                # Convert 'generic_tpu.json' -> 'generic_tpu'
-                material_name = f.stem.upper()  # Convert to uppercase for consistency
-                discovered_materials.add(material_name)
+        if profiles_mtime is not None:
+            try:
+                with os.scandir(self.filament_profiles_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if (
+                            name.endswith(".json")
+                            and not name.startswith(".")
+                            and entry.is_file()
+                        ):
+                            # Convert 'generic_tpu.json' -> 'GENERIC_TPU'
+                            discovered_materials.add(name[:-5].upper())
+            except OSError:
+                pass
 
-        # 3. Combine, ensuring original casing is preferred, and sort.
-        all_materials = sorted(official_materials.union(discovered_materials))
-        return all_materials
+        # 2. Combine with the official materials, ensuring original casing is
+        # preferred, and sort.
+        all_materials = tuple(sorted(MATERIAL_BY_NAME.keys() | discovered_materials))
+        self._materials_cache = (profiles_mtime, all_materials)
+        return list(all_materials)
 
     async def slice_model(
-        self, model_path: str, material: MaterialType | None = None
+        self, model_path: str, material: MaterialType | str | None = None
     ) -> SlicingResult:
         """
         Slice a 3D model and extract print information.
 
         Args:
             model_path: Path to the 3D model file
-            material: Material type to use for slicing
+            material: Material type or custom material name to use for slicing
 
         Returns:
             SlicingResult with print time and filament usage
@@ -115,14 +217,13 @@ class OrcaSlicerService:
         Raises:
             SlicerError: If slicing fails
         """
-        if not os.path.exists(model_path):
+        if not await asyncio.to_thread(os.path.exists, model_path):
             raise SlicerError(f"Model file not found: {model_path}")
 
-        profiles = self.get_profile_paths(material)
+        load_settings, load_filaments = self._get_slicer_profile_args(material)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        async with _scratch_dir() as temp_dir:
             output_dir = Path(temp_dir) / "output"
-            output_dir.mkdir(exist_ok=True)
 
             # Build command
             command = [
@@ -131,9 +232,9 @@ class OrcaSlicerService:
                 "--slice",
                 "0",  # Slice all plates
                 "--load-settings",
-                f"{profiles['machine']};{profiles['process']}",
+                load_settings,
                 "--load-filaments",
-                profiles["filament"],
+                load_filaments,
                 "--export-slicedata",
                 str(output_dir),
                 "--outputdir",
@@ -146,17 +247,36 @@ class OrcaSlicerService:
                 # Run slicer process
                 process = await asyncio.create_subprocess_exec(
                     *command,
-                    stdout=asyncio.subprocess.PIPE,
+                    # Nothing reads the slicer's stdout; results come from output_dir
+                    stdout=asyncio.subprocess.DEVNULL,
                     stderr=asyncio.subprocess.PIPE,
                     cwd=temp_dir,
                 )
 
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=self.settings.slicer_timeout
-                )
+                stderr_tail: deque[bytes] = deque(maxlen=_PIPE_TAIL_CHUNKS)
+
+                async def run_to_exit() -> None:
+                    await _drain_tail(process.stderr, stderr_tail)  # type: ignore[arg-type]
+                    await process.wait()
+
+                try:
+                    await asyncio.wait_for(
+                        run_to_exit(), timeout=self.settings.slicer_timeout
+                    )
+                except TimeoutError:
+                    # Don't leave the slicer running once we stop reading it
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+                    await process.wait()
+                    raise
 
                 if process.returncode != 0:
-                    error_msg = stderr.decode() if stderr else "Unknown slicer error"
+                    stderr = b"".join(stderr_tail)
+                    error_msg = (
+                        stderr.decode(errors="replace")
+                        if stderr
+                        else "Unknown slicer error"
+                    )
                     raise SlicerError(f"Slicer failed: {error_msg}")
 
                 # Parse results using Rust implementation
@@ -1,12 +1,64 @@
 """Telegram bot service for admin notifications."""
 
+import logging
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import lru_cache, wraps
+from typing import Any, ParamSpec
+
 import httpx
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 
 from orca_quote_machine.core.config import Settings, get_settings
 from orca_quote_machine.models.quote import TelegramMessage
 
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+
+# Quote and failure notifications are sent concurrently from the worker loop;
+# PTB's default single-connection pool would time out the overlapping ones
+BOT_CONNECTION_POOL_SIZE = 8
+
+
+@lru_cache(maxsize=4)
+def _get_bot(token: str) -> Bot:
+    """Share one Bot, and with it one HTTP connection pool, per token."""
+    return Bot(
+        token=token,
+        request=HTTPXRequest(connection_pool_size=BOT_CONNECTION_POOL_SIZE),
+    )
+
+
+def _telegram_guard(
+    action: str,
+) -> Callable[[Callable[P, Awaitable[bool]]], Callable[P, Coroutine[Any, Any, bool]]]:
+    """Log and swallow failures while ``action`` runs, returning False instead."""
+
+    def decorator(
+        func: Callable[P, Awaitable[bool]],
+    ) -> Callable[P, Coroutine[Any, Any, bool]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> bool:
+            try:
+                return await func(*args, **kwargs)
+            except TelegramError as e:
+                logger.error("Telegram error while %s: %s", action, e)
+            except httpx.HTTPError as e:
+                logger.error("HTTP error while %s: %s", action, e)
+            except (ConnectionError, TimeoutError) as e:
+                logger.error("Network error while %s: %s", action, e)
+            except Exception as e:
+                logger.error(
+                    "Unexpected error while %s: %s: %s", action, type(e).__name__, e
+                )
+            return False
+
+        return wrapper
+
+    return decorator
+
 
 class TelegramService:
     """Service for sending notifications via Telegram bot."""
@@ -16,8 +68,9 @@ class TelegramService:
         self.bot: Bot | None = None
 
         if self.settings.telegram_bot_token:
-            self.bot = Bot(token=self.settings.telegram_bot_token)
+            self.bot = _get_bot(self.settings.telegram_bot_token)
 
+    @_telegram_guard("sending Telegram notification")
     async def send_quote_notification(self, message: TelegramMessage) -> bool:
         """
         Send quote notification to admin via Telegram.
@@ -29,73 +82,36 @@ class TelegramService:
             True if sent successfully, False otherwise
         """
         if not self.bot or not self.settings.telegram_admin_chat_id:
-            print("Telegram bot not configured - notification not sent")
+            logger.warning("Telegram bot not configured - notification not sent")
             return False
 
-        try:
-            formatted_message = message.format_message()
+        await self.bot.send_message(
+            chat_id=self.settings.telegram_admin_chat_id,
+            text=message.format_message(),
+            parse_mode="HTML",
+        )
 
-            await self.bot.send_message(
-                chat_id=self.settings.telegram_admin_chat_id,
-                text=formatted_message,
-                parse_mode="HTML",
-            )
-
-            print(f"Quote notification sent for {message.quote_id}")
-            return True
-
-        except TelegramError as e:
-            print(f"Failed to send Telegram notification: {e}")
-            return False
-        except httpx.HTTPError as e:
-            print(f"HTTP error while sending Telegram notification: {e}")
-            return False
-        except (ConnectionError, TimeoutError) as e:
-            print(f"Network error while sending Telegram notification: {e}")
-            return False
-        except Exception as e:
-            print(f"Unexpected error sending Telegram notification: {type(e).__name__}: {e}")
-            return False
+        logger.info("Quote notification sent for %s", message.quote_id)
+        return True
 
+    @_telegram_guard("sending error notification")
     async def send_error_notification(self, error_message: str, quote_id: str) -> bool:
         """Send error notification to admin."""
         if not self.bot or not self.settings.telegram_admin_chat_id:
             return False
 
-        try:
-            message = f"Quote Processing Error #{quote_id}\n\n{error_message}"
-
-            await self.bot.send_message(
-                chat_id=self.settings.telegram_admin_chat_id, text=message
-            )
-
-            return True
-
-        except httpx.HTTPError as e:
-            print(f"HTTP error while sending error notification: {e}")
-            return False
-        except (ConnectionError, TimeoutError) as e:
-            print(f"Network error while sending error notification: {e}")
-            return False
-        except Exception as e:
-            print(f"Failed to send error notification: {type(e).__name__}: {e}")
-            return False
+        await self.bot.send_message(
+            chat_id=self.settings.telegram_admin_chat_id,
+            text=f"Quote Processing Error #{quote_id}\n\n{error_message}",
+        )
+        return True
 
+    @_telegram_guard("testing Telegram connection")
     async def test_connection(self) -> bool:
         """Test Telegram bot connection."""
         if not self.bot:
             return False
 
-        try:
-            bot_info = await self.bot.get_me()
-            print(f"Telegram bot connected: @{bot_info.username}")
-            return True
-        except httpx.HTTPError as e:
-            print(f"HTTP error while testing Telegram connection: {e}")
-            return False
-        except (ConnectionError, TimeoutError) as e:
-            print(f"Network error while testing Telegram connection: {e}")
-            return False
-        except Exception as e:
-            print(f"Telegram bot connection failed: {type(e).__name__}: {e}")
-            return False
+        bot_info = await self.bot.get_me()
+        logger.info("Telegram bot connected: @%s", bot_info.username)
+        return True
@@ -3,17 +3,25 @@
 import asyncio
 import contextlib
 import os
+import threading
 import uuid
-from datetime import datetime
-from typing import Any
+from collections.abc import Coroutine
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, TypeVar
 
 from celery import Celery, Task
+from celery.signals import worker_process_shutdown, worker_shutdown
 from celery.utils.log import get_task_logger
 
 # Import Rust functions
 from orca_quote_machine._rust_core import cleanup_old_files_rust, validate_3d_model
 from orca_quote_machine.core.config import get_settings
-from orca_quote_machine.models.quote import MaterialType, TelegramMessage
+from orca_quote_machine.models.quote import (
+    MATERIAL_BY_NAME,
+    MaterialType,
+    TelegramMessage,
+)
 from orca_quote_machine.services.pricing import PricingService
 from orca_quote_machine.services.slicer import OrcaSlicerService
 from orca_quote_machine.services.telegram import TelegramService
@@ -21,8 +29,13 @@ from orca_quote_machine.services.telegram import TelegramService
 settings = get_settings()
 logger = get_task_logger(__name__)
 
+# Test environments run tasks eagerly against an in-memory broker
+_EAGER_MODE = bool(
+    os.getenv("PYTEST_CURRENT_TEST") or os.getenv("CELERY_TASK_ALWAYS_EAGER")
+)
+
 # Initialize Celery with test-aware configuration
-if os.getenv("PYTEST_CURRENT_TEST") or os.getenv("CELERY_TASK_ALWAYS_EAGER"):
+if _EAGER_MODE:
     # Use in-memory broker for testing
     celery_app = Celery(
         "orca_quote_machine",
@@ -47,7 +60,7 @@ celery_config = {
 }
 
 # Add eager mode for testing
-if os.getenv("PYTEST_CURRENT_TEST") or os.getenv("CELERY_TASK_ALWAYS_EAGER"):
+if _EAGER_MODE:
     celery_config.update(
         {
             "task_always_eager": True,
@@ -57,6 +70,118 @@ if os.getenv("PYTEST_CURRENT_TEST") or os.getenv("CELERY_TASK_ALWAYS_EAGER"):
 
 celery_app.conf.update(**celery_config)
 
+# Display formats for the admin notification
+_PRINT_TIME_FMT = "%dh %dm"
+_FILAMENT_WEIGHT_FMT = "%.1fg"
+
+
+@lru_cache(maxsize=1)
+def _get_slicer_service() -> OrcaSlicerService:
+    """Worker-wide slicer service, so its profile caches survive across tasks."""
+    return OrcaSlicerService(settings=get_settings())
+
+
+@lru_cache(maxsize=1)
+def _get_pricing_service() -> PricingService:
+    """Worker-wide pricing service, so its material price lookups are reused."""
+    return PricingService(settings=get_settings())
+
+
+@lru_cache(maxsize=1)
+def _get_telegram_service() -> TelegramService:
+    """Worker-wide Telegram service, so the bot's connection pool is reused."""
+    return TelegramService(settings=get_settings())
+
+
+T = TypeVar("T")
+
+# One event loop per worker process, run in a daemon thread. It is created
+# lazily so prefork children each start their own after forking.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the worker's long-lived event loop, starting it on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="quote-worker-loop", daemon=True
+            )
+            _loop_thread.start()
+    return _loop
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the worker loop and block until it completes."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+# Fire-and-forget coroutines still running on the worker loop. The loop only
+# keeps weak references to tasks, so hold them here until they finish.
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+# How long shutdown waits for queued notifications before stopping the loop
+_SHUTDOWN_GRACE_SECONDS = 10.0
+
+
+def _spawn_background(coro: Coroutine[Any, Any, Any]) -> None:
+    """Schedule a coroutine on the running loop without waiting for it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _queue_async(coro: Coroutine[Any, Any, Any]) -> None:
+    """Hand a coroutine to the worker loop from a task thread without waiting."""
+    _get_event_loop().call_soon_threadsafe(_spawn_background, coro)
+
+
+async def _wait_for_background_tasks() -> None:
+    """Give queued notifications a bounded chance to finish."""
+    if _background_tasks:
+        await asyncio.wait(set(_background_tasks), timeout=_SHUTDOWN_GRACE_SECONDS)
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def _stop_event_loop(**kwargs: Any) -> None:
+    """Stop and close the worker loop when the worker process shuts down."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        # Anything run after this starts a fresh loop instead of the stopped one
+        _loop = _loop_thread = None
+    if loop is None or loop.is_closed():
+        return
+
+    if loop.is_running():
+        with contextlib.suppress(Exception):
+            asyncio.run_coroutine_threadsafe(
+                _wait_for_background_tasks(), loop
+            ).result()
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=_SHUTDOWN_GRACE_SECONDS)
+    if not loop.is_running():
+        loop.close()
+
+
+def _forget_event_loop() -> None:
+    """Drop a loop inherited over fork; its thread did not survive into the child."""
+    global _loop, _loop_thread, _loop_lock
+    _loop = _loop_thread = None
+    # The parent may have held the lock at fork time
+    _loop_lock = threading.Lock()
+    _background_tasks.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_event_loop)
+
 
 @celery_app.task(bind=True)
 def process_quote_request(
@@ -68,7 +193,7 @@ def process_quote_request(
     Args:
         file_path: Path to uploaded 3D model file
         quote_data: Quote request data
-        material: Material type (PLA, PETG, ASA)
+        material: Material name (PLA, PETG, ASA or a custom filament profile)
 
     Returns:
         Dictionary with processing results
@@ -85,19 +210,17 @@ def process_quote_request(
             raise Exception(f"Invalid 3D model: {validation_result.error_message}")
         logger.info(f"File validation passed: {validation_result.file_type}")
 
-        # Parse material
-        material_enum = None
+        # Official materials resolve to their enum member; custom materials
+        # keep their name so slicing and pricing use their own profile
+        material_choice: MaterialType | str | None = None
         if material:
-            try:
-                material_enum = MaterialType(material.upper())
-            except ValueError:
-                logger.warning(f"Unknown material {material}, defaulting to PLA")
-                material_enum = MaterialType.PLA
+            material_key = material.upper()
+            material_choice = MATERIAL_BY_NAME.get(material_key, material_key)
 
         # Run async processing pipeline
-        result = asyncio.run(
+        result = _run_async(
             run_processing_pipeline(
-                file_path, quote_data, material_enum, quote_id, short_quote_id
+                file_path, quote_data, material_choice, quote_id, short_quote_id
             )
         )
         return result
@@ -106,23 +229,25 @@ def process_quote_request(
         error_msg = str(e)
         logger.error(f"Quote processing failed for {short_quote_id}: {error_msg}")
 
-        # Send error notification
+        # Notify the admin in the background so cleanup and the task result
+        # do not wait on the Telegram round trip
         with contextlib.suppress(Exception):
-            asyncio.run(send_failure_notification(error_msg, short_quote_id))
+            _queue_async(send_failure_notification(error_msg, short_quote_id))
 
         return {
             "success": False,
             "quote_id": quote_id,
             "error": error_msg,
-            "processed_at": datetime.utcnow().isoformat(),
+            "processed_at": datetime.now(UTC).isoformat(),
         }
 
     finally:
-        # Cleanup uploaded file
+        # Cleanup uploaded file; a missing file needs no stat to detect
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"Cleaned up file: {file_path}")
+            os.unlink(file_path)
+            logger.info(f"Cleaned up file: {file_path}")
+        except FileNotFoundError:
+            pass
         except OSError as e:
             logger.warning(f"Failed to cleanup file {file_path}: {e}")
 
@@ -130,43 +255,42 @@ def process_quote_request(
 async def run_processing_pipeline(
     file_path: str,
     quote_data: dict,
-    material_enum: MaterialType | None,
+    material: MaterialType | str | None,
     quote_id: str,
     short_quote_id: str,
 ) -> dict[str, Any]:
     """
     Helper async function to orchestrate async calls in the processing pipeline.
     """
-    # Get fresh settings for services
-    settings = get_settings()
-
     # Run slicing
-    slicer_service = OrcaSlicerService(settings=settings)
-    slicing_result = await slicer_service.slice_model(file_path, material_enum)
+    slicer_service = _get_slicer_service()
+    slicing_result = await slicer_service.slice_model(file_path, material)
     logger.info(
         f"Slicing completed: {slicing_result.print_time_minutes}min, {slicing_result.filament_weight_grams}g"
     )
 
     # Calculate pricing
-    pricing_service = PricingService(settings=settings)
-    cost_breakdown = pricing_service.calculate_quote(slicing_result, material_enum)
+    pricing_service = _get_pricing_service()
+    cost_breakdown = pricing_service.calculate_quote(slicing_result, material)
     logger.info(f"Pricing calculated: S${cost_breakdown.total_cost:.2f}")
 
     # Send Telegram notification
-    telegram_service = TelegramService(settings=settings)
+    telegram_service = _get_telegram_service()
     telegram_message = TelegramMessage(
         quote_id=short_quote_id,
         customer_name=quote_data["name"],
         customer_mobile=quote_data["mobile"],
-        material=material_enum.value if material_enum else None,
+        material=getattr(material, "value", material),
         color=quote_data.get("color"),
         filename=quote_data["filename"],
-        print_time=f"{slicing_result.print_time_minutes // 60}h {slicing_result.print_time_minutes % 60}m",
-        filament_weight=f"{slicing_result.filament_weight_grams:.1f}g",
+        print_time=_PRINT_TIME_FMT % divmod(slicing_result.print_time_minutes, 60),
+        filament_weight=_FILAMENT_WEIGHT_FMT % slicing_result.filament_weight_grams,
         total_cost=cost_breakdown.total_cost,
     )
 
-    notification_sent = await telegram_service.send_quote_notification(telegram_message)
+    # Don't hold up the task result on the Telegram round-trip; delivery
+    # failures are logged by TelegramService
+    _spawn_background(telegram_service.send_quote_notification(telegram_message))
 
     return {
         "success": True,
@@ -182,15 +306,17 @@ async def run_processing_pipeline(
             "print_time_hours": cost_breakdown.print_time_hours,
             "minimum_applied": cost_breakdown.minimum_applied,
         },
-        "notification_sent": notification_sent,
-        "processed_at": datetime.utcnow().isoformat(),
+        # Stays a bool for /status consumers; delivery is confirmed only after
+        # the task returns, so it is not yet known to have been sent
+        "notification_sent": False,
+        "notification_queued": True,
+        "processed_at": datetime.now(UTC).isoformat(),
     }
 
 
 async def send_failure_notification(error_msg: str, quote_id: str) -> None:
     """Send error notification to admin."""
-    settings = get_settings()
-    telegram_service = TelegramService(settings=settings)
+    telegram_service = _get_telegram_service()
     await telegram_service.send_error_notification(error_msg, quote_id)
 
 
@@ -210,11 +336,16 @@ def cleanup_old_files(max_age_hours: int = 24) -> dict[str, Any]:
         logger.info(
             f"Cleaned up {stats.files_cleaned} old files, freeing {stats.bytes_freed} bytes."
         )
+        if stats.files_failed:
+            logger.warning(
+                f"Could not remove {stats.files_failed} old files; retrying next run."
+            )
 
         return {
-            "success": True,
+            "success": stats.files_failed == 0,
             "files_cleaned": stats.files_cleaned,
             "bytes_freed": stats.bytes_freed,
+            "files_failed": stats.files_failed,
         }
 
     except Exception as e:
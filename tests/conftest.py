@@ -1,25 +1,87 @@
 """Core test configuration and fixtures."""
 
 import os
+import shutil
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator, Mapping
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
-from pytest_mock import MockerFixture
 
-# Configure Celery for testing before importing the app
-os.environ["CELERY_TASK_ALWAYS_EAGER"] = "True"
-os.environ["CELERY_TASK_EAGER_PROPAGATES"] = "True"
+# Settings are read once at import, so the environment must be set first
 os.environ["PYTEST_CURRENT_TEST"] = "conftest.py"
 os.environ["MAX_FILE_SIZE"] = "104857600"
 os.environ["SECRET_KEY"] = "test-secret-key-for-pytest"
 
+from orca_quote_machine import main, tasks
 from orca_quote_machine.core.config import get_settings
 from orca_quote_machine.main import app
 
+SAMPLE_STL_CONTENT = b"""solid test_model
+facet normal 0.0 0.0 1.0
+  outer loop
+    vertex 0.0 0.0 0.0
+    vertex 1.0 0.0 0.0
+    vertex 0.0 1.0 0.0
+  endloop
+endfacet
+endsolid test_model"""
+
+# Form data shared read-only by every test that asks for it
+SAMPLE_QUOTE_DATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "John Doe",
+        "mobile": "+6591234567",
+        "material": "PLA",
+        "color": "Red",
+    }
+)
+INVALID_QUOTE_DATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "name": "",  # Invalid: empty name
+        "mobile": "invalid-phone",  # Invalid format
+        "material": "INVALID_MATERIAL",  # Invalid material
+        "color": "A" * 100,  # Invalid: too long
+    }
+)
+
+
+def _make_test_gcode_dir(parent: str, print_time: str, filament: str) -> str:
+    """Create a directory under parent holding a minimal sliced G-code file."""
+    temp_dir = tempfile.mkdtemp(dir=parent)
+    gcode_file = os.path.join(temp_dir, 'output.gcode')
+    with open(gcode_file, 'w') as f:
+        f.write(f'; estimated printing time: {print_time}\n')
+        f.write(f'; filament used: {filament}\n')
+        f.write('; layer_count: 150\n')
+    return temp_dir
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run Celery tasks eagerly in-process on an in-memory broker."""
+    tasks.celery_app.conf.update(
+        task_always_eager=True,
+        task_eager_propagates=True,
+        broker_url="memory://",
+        result_backend="cache+memory://",
+    )
+
+
+@pytest.fixture(scope="session")
+def tmp_root() -> Generator[str, None, None]:
+    """Session-wide scratch directory, RAM-backed where /dev/shm exists.
+
+    Fixtures create their files under it and leave them there; the whole
+    tree is removed once at the end of the session.
+    """
+    parent = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    root = tempfile.mkdtemp(prefix="orca-tests-", dir=parent)
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
 
 @pytest.fixture(scope="session")
 def celery_config() -> dict[str, Any]:
@@ -32,64 +94,77 @@ def celery_config() -> dict[str, Any]:
     }
 
 
-@pytest.fixture(scope="module")
-def client() -> TestClient:
-    """Provides a TestClient for making requests to the FastAPI app."""
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Provides a TestClient for making requests to the FastAPI app.
+
+    The app's lifespan runs once for the whole session; per-test state is
+    reset by ``restore_dependency_overrides``.
+    """
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture
-def test_settings() -> Any:
-    """Override settings for testing."""
+@pytest.fixture(autouse=True)
+def restore_dependency_overrides() -> Generator[None, None, None]:
+    """Undo any dependency overrides a test installs on the shared app."""
+    saved = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
+
+
+@pytest.fixture(autouse=True)
+def test_settings(
+    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
+) -> Any:
+    """Override settings for testing.
+
+    Every test gets a fresh upload directory from pytest's own temp tree,
+    which pytest prunes itself, so nothing has to be cleaned per test.
+    """
     settings = get_settings()
-    # Create temporary upload directory
-    temp_dir = tempfile.mkdtemp()
-    settings.upload_dir = temp_dir
+    upload_dir = tmp_path_factory.mktemp("uploads")
+    settings.upload_dir = str(upload_dir)
+    # The app resolves its upload directory once at import
+    monkeypatch.setattr(main, "UPLOAD_DIR", upload_dir)
     settings.max_file_size = 10 * 1024 * 1024  # 10MB for tests
     settings.secret_key = "test-secret-key"
 
-    yield settings
-
-    # Cleanup the temporary directory
-    import shutil
-    if os.path.exists(temp_dir):
-        shutil.rmtree(temp_dir)
+    return settings
 
 
 @pytest.fixture
-def mock_orcaslicer_cli(mocker: MockerFixture) -> MagicMock:
+def mock_orcaslicer_cli(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
     """Mock only the OrcaSlicer CLI subprocess call."""
     # Mock at the subprocess level, not the service level
-    mock_subprocess = mocker.patch("asyncio.create_subprocess_exec")
-    mock_process = mocker.AsyncMock()
+    mock_process = AsyncMock()
     mock_process.returncode = 0
-    mock_process.communicate = mocker.AsyncMock(return_value=(b"Success", b""))
-    mock_subprocess.return_value = mock_process
+    mock_process.stderr.read = AsyncMock(return_value=b"")
+    mock_process.wait = AsyncMock(return_value=0)
+    mock_subprocess = AsyncMock(return_value=mock_process)
+    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_subprocess)
     return mock_subprocess
 
 
-@pytest.fixture
-def sample_slicing_result(create_test_gcode_dir):
+# The sample_* results below are read-only Rust value objects, so each is
+# built once per session and shared
+
+@pytest.fixture(scope="session")
+def sample_slicing_result(tmp_root: str):
     """Create a real SlicingResult for testing."""
     import asyncio
 
     from orca_quote_machine._rust_core import parse_slicer_output
 
     # Create a test G-code directory with expected content
-    temp_dir = create_test_gcode_dir(print_time="2h 0m", filament="50.0g")
+    temp_dir = _make_test_gcode_dir(tmp_root, print_time="2h 0m", filament="50.0g")
 
     # Use the real Rust parser to create a SlicingResult
-    slicing_result = asyncio.run(parse_slicer_output(temp_dir))
-
-    # Clean up the temporary directory
-    import shutil
-    shutil.rmtree(temp_dir)
+    return asyncio.run(parse_slicer_output(temp_dir))
 
-    return slicing_result
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cost_breakdown():
     """Create a real CostBreakdown for testing."""
     from orca_quote_machine._rust_core import calculate_quote_rust
@@ -100,22 +175,24 @@ def sample_cost_breakdown():
     return calculate_quote_rust(120, 50.0, "PLA", 25.0, 0.5, 1.1, 5.0)
 
 
-@pytest.fixture
-def sample_model_info(temp_upload_file):
+@pytest.fixture(scope="session")
+def sample_model_info(tmp_root: str):
     """Create a real ModelInfo for testing."""
     from orca_quote_machine._rust_core import validate_3d_model
 
     # Use the real Rust validator with a temporary test file
-    return validate_3d_model(temp_upload_file)
+    with tempfile.NamedTemporaryFile(suffix=".stl", dir=tmp_root, delete=False) as f:
+        f.write(SAMPLE_STL_CONTENT)
+    return validate_3d_model(f.name)
 
 
-@pytest.fixture
-def sample_cleanup_stats():
+@pytest.fixture(scope="session")
+def sample_cleanup_stats(tmp_root: str):
     """Create a real CleanupStats for testing."""
     from orca_quote_machine._rust_core import cleanup_old_files_rust
 
     # Create a temporary directory with old files
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = tempfile.mkdtemp(dir=tmp_root)
 
     # Create some test files
     for i in range(3):
@@ -127,113 +204,64 @@ def sample_cleanup_stats():
         os.utime(test_file, (old_time, old_time))
 
     # Run cleanup on the directory
-    stats = cleanup_old_files_rust(temp_dir, 24)
-
-    # Clean up the directory
-    import shutil
-    shutil.rmtree(temp_dir)
-
-    return stats
+    return cleanup_old_files_rust(temp_dir, 24)
 
 
 @pytest.fixture
-def mock_telegram_api(mocker: MockerFixture) -> MagicMock:
+def mock_telegram_api(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
     """Mock only the Telegram HTTP API calls."""
     # Mock at the HTTP level, not the service level
-    mock_post = mocker.patch("httpx.AsyncClient.post")
-    mock_response = mocker.AsyncMock()
+    mock_response = AsyncMock()
     mock_response.status_code = 200
-    mock_response.json = mocker.AsyncMock(return_value={"ok": True})
-    mock_post.return_value = mock_response
+    mock_response.json = AsyncMock(return_value={"ok": True})
+    mock_post = AsyncMock(return_value=mock_response)
+    monkeypatch.setattr("httpx.AsyncClient.post", mock_post)
     return mock_post
 
 
 @pytest.fixture
-def create_test_gcode_dir():
+def create_test_gcode_dir(tmp_root: str) -> Callable[..., str]:
     """Create a temporary directory with test G-code file."""
-    created_dirs = []
 
-    def _create_gcode(print_time="2h 0m", filament="100.0g"):
-        temp_dir = tempfile.mkdtemp()
-        created_dirs.append(temp_dir)
-        gcode_file = os.path.join(temp_dir, 'output.gcode')
-        with open(gcode_file, 'w') as f:
-            f.write(f'; estimated printing time: {print_time}\n')
-            f.write(f'; filament used: {filament}\n')
-            f.write('; layer_count: 150\n')
-        return temp_dir
+    def _create_gcode(print_time: str = "2h 0m", filament: str = "100.0g") -> str:
+        return _make_test_gcode_dir(tmp_root, print_time, filament)
 
-    yield _create_gcode
-
-    # Cleanup all created directories
-    import shutil
-    for temp_dir in created_dirs:
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
+    return _create_gcode
 
 
 @pytest.fixture
 def sample_stl_content() -> bytes:
     """Sample STL file content for testing."""
-    return b"""solid test_model
-facet normal 0.0 0.0 1.0
-  outer loop
-    vertex 0.0 0.0 0.0
-    vertex 1.0 0.0 0.0
-    vertex 0.0 1.0 0.0
-  endloop
-endfacet
-endsolid test_model"""
+    return SAMPLE_STL_CONTENT
 
 
 @pytest.fixture
-def sample_quote_data() -> dict[str, Any]:
+def sample_quote_data() -> Mapping[str, Any]:
     """Sample valid quote request data."""
-    return {
-        "name": "John Doe",
-        "mobile": "+6591234567",
-        "material": "PLA",
-        "color": "Red",
-    }
+    return SAMPLE_QUOTE_DATA
 
 
 @pytest.fixture
-def invalid_quote_data() -> dict[str, Any]:
+def invalid_quote_data() -> Mapping[str, Any]:
     """Sample invalid quote request data for testing validation."""
-    return {
-        "name": "",  # Invalid: empty name
-        "mobile": "invalid-phone",  # Invalid format
-        "material": "INVALID_MATERIAL",  # Invalid material
-        "color": "A" * 100,  # Invalid: too long
-    }
+    return INVALID_QUOTE_DATA
 
 
 @pytest.fixture
-def temp_upload_file(sample_stl_content: bytes) -> Generator[str, None, None]:
+def temp_upload_file(sample_stl_content: bytes, tmp_root: str) -> str:
     """Create a temporary file for upload testing."""
-    with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as f:
+    with tempfile.NamedTemporaryFile(suffix=".stl", dir=tmp_root, delete=False) as f:
         f.write(sample_stl_content)
-        f.flush()
-        yield f.name
-    # Cleanup
-    os.unlink(f.name)
+    return f.name
 
 
 @pytest.fixture(autouse=True)
-def cleanup_uploads(test_settings):
-    """Automatically cleanup upload directory after each test."""
+def reset_worker_services() -> Generator[None, None, None]:
+    """Drop worker-wide services so per-test service mocks are always used."""
+    tasks._get_slicer_service.cache_clear()
+    tasks._get_pricing_service.cache_clear()
+    tasks._get_telegram_service.cache_clear()
     yield
-
-    # Clean up any files left in the upload directory
-    import shutil
-    upload_dir = test_settings.upload_dir
-    if os.path.exists(upload_dir):
-        for filename in os.listdir(upload_dir):
-            file_path = os.path.join(upload_dir, filename)
-            try:
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception:
-                pass  # Ignore errors during cleanup
+    tasks._get_slicer_service.cache_clear()
+    tasks._get_pricing_service.cache_clear()
+    tasks._get_telegram_service.cache_clear()
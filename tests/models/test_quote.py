@@ -14,6 +14,9 @@ from orca_quote_machine.models.quote import (
     TelegramMessage,
 )
 
+# Characters allowed as formatting in a mobile number
+_MOBILE_FORMATTING = str.maketrans("", "", "+-() .")
+
 
 class TestMaterialType:
     """Tests for MaterialType enum."""
@@ -53,7 +56,7 @@ class TestQuoteRequest:
             "filename": "test.stl",
         }
 
-        quote = QuoteRequest(**data)
+        quote = QuoteRequest.model_validate(data)
 
         assert quote.name == "John Doe"
         assert quote.mobile == "+6591234567"
@@ -65,7 +68,7 @@ class TestQuoteRequest:
         """Test quote request with optional fields."""
         data = {"name": "Jane Doe", "mobile": "91234567", "filename": "model.stl"}
 
-        quote = QuoteRequest(**data)
+        quote = QuoteRequest.model_validate(data)
 
         assert quote.name == "Jane Doe"
         assert quote.mobile == "91234567"
@@ -73,74 +76,72 @@ class TestQuoteRequest:
         assert quote.color is None
         assert quote.filename == "model.stl"
 
-    def test_name_validation_valid(self):
-        """Test valid name validation."""
-        valid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "John Doe",
             "Mary-Jane",
             "O'Connor",
             "Jean-Luc",
             "Dr. Smith",
             "李明",
-        ]
-
-        for name in valid_names:
-            data = {"name": name, "mobile": "+6591234567", "filename": "test.stl"}
-            quote = QuoteRequest(**data)
-            assert quote.name == name.strip()
+        ],
+    )
+    def test_name_validation_valid(self, name: str):
+        """Test valid name validation."""
+        data = {"name": name, "mobile": "+6591234567", "filename": "test.stl"}
+        quote = QuoteRequest.model_validate(data)
+        assert quote.name == name.strip()
 
-    def test_name_validation_invalid(self):
-        """Test invalid name validation."""
-        invalid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "",  # Empty
             "   ",  # Only whitespace
             "A" * 101,  # Too long
             "John123",  # Contains numbers
             "John@Doe",  # Contains special chars
-        ]
-
-        for name in invalid_names:
-            data = {"name": name, "mobile": "+6591234567", "filename": "test.stl"}
-            with pytest.raises(ValidationError):
-                QuoteRequest(**data)
+        ],
+    )
+    def test_name_validation_invalid(self, name: str):
+        """Test invalid name validation."""
+        data = {"name": name, "mobile": "+6591234567", "filename": "test.stl"}
+        with pytest.raises(ValidationError):
+            QuoteRequest.model_validate(data)
 
-    def test_mobile_validation_valid(self):
-        """Test valid mobile number validation."""
-        valid_mobiles = [
+    @pytest.mark.parametrize(
+        "mobile",
+        [
             "+6591234567",
             "91234567",
             "+1-555-123-4567",
             "+44 20 7946 0958",
             "(555) 123-4567",
             "555.123.4567",
-        ]
-
-        for mobile in valid_mobiles:
-            data = {"name": "John Doe", "mobile": mobile, "filename": "test.stl"}
-            quote = QuoteRequest(**data)
-            # Check that formatting is cleaned up
-            cleaned_mobile = (
-                quote.mobile.replace("+", "").replace("-", "").replace(" ", "")
-            )
-            cleaned_mobile = (
-                cleaned_mobile.replace("(", "").replace(")", "").replace(".", "")
-            )
-            assert cleaned_mobile.isdigit()
-
-    def test_mobile_validation_invalid(self):
-        """Test invalid mobile number validation."""
-        invalid_mobiles = [
+        ],
+    )
+    def test_mobile_validation_valid(self, mobile: str):
+        """Test valid mobile number validation."""
+        data = {"name": "John Doe", "mobile": mobile, "filename": "test.stl"}
+        quote = QuoteRequest.model_validate(data)
+        # Check that formatting is cleaned up
+        assert quote.mobile.translate(_MOBILE_FORMATTING).isdigit()
+
+    @pytest.mark.parametrize(
+        "mobile",
+        [
             "",  # Empty
             "123",  # Too short
             "abcdefghij",  # Not numeric
             "++6591234567",  # Multiple plus signs
             "1234567890123456",  # Too long
-        ]
-
-        for mobile in invalid_mobiles:
-            data = {"name": "John Doe", "mobile": mobile, "filename": "test.stl"}
-            with pytest.raises(ValidationError):
-                QuoteRequest(**data)
+        ],
+    )
+    def test_mobile_validation_invalid(self, mobile: str):
+        """Test invalid mobile number validation."""
+        data = {"name": "John Doe", "mobile": mobile, "filename": "test.stl"}
+        with pytest.raises(ValidationError):
+            QuoteRequest.model_validate(data)
 
     def test_filename_validation(self):
         """Test filename validation."""
@@ -151,7 +152,17 @@ class TestQuoteRequest:
         }
 
         with pytest.raises(ValidationError):
-            QuoteRequest(**data)
+            QuoteRequest.model_validate(data)
+
+    def test_quote_request_is_frozen_and_hashable(self):
+        """Test that a validated request cannot be mutated and can be hashed."""
+        data = {"name": "John Doe", "mobile": "+6591234567", "filename": "test.stl"}
+        request = QuoteRequest.model_validate(data)
+
+        with pytest.raises(ValidationError):
+            request.name = "Jane Doe"
+
+        assert hash(request) == hash(QuoteRequest.model_validate(data))
 
 
 class TestSlicingResult:
@@ -166,7 +177,7 @@ class TestSlicingResult:
             "estimated_cost": 30.25,
         }
 
-        result = SlicingResult(**data)
+        result = SlicingResult.model_validate(data)
 
         assert result.print_time_minutes == 120
         assert result.filament_weight_grams == 25.5
@@ -177,7 +188,7 @@ class TestSlicingResult:
         """Test slicing result with only required fields."""
         data = {"print_time_minutes": 60, "filament_weight_grams": 15.0}
 
-        result = SlicingResult(**data)
+        result = SlicingResult.model_validate(data)
 
         assert result.print_time_minutes == 60
         assert result.filament_weight_grams == 15.0
@@ -217,7 +228,7 @@ class TestQuoteResponse:
             "processed_at": now,
         }
 
-        response = QuoteResponse(**data)
+        response = QuoteResponse.model_validate(data)
 
         assert response.request_id == "test-123"
         assert response.name == "John Doe"
@@ -242,7 +253,7 @@ class TestQuoteResponse:
             "created_at": datetime.now(),
         }
 
-        response = QuoteResponse(**data)
+        response = QuoteResponse.model_validate(data)
 
         # Should calculate hours from minutes
         assert response.print_time_hours == 2.5
@@ -265,7 +276,7 @@ class TestTelegramMessage:
             "total_cost": 30.25,
         }
 
-        message = TelegramMessage(**data)
+        message = TelegramMessage.model_validate(data)
 
         assert message.quote_id == "test-123"
         assert message.customer_name == "John Doe"
@@ -285,7 +296,7 @@ class TestTelegramMessage:
             "total_cost": 30.25,
         }
 
-        message = TelegramMessage(**data)
+        message = TelegramMessage.model_validate(data)
         formatted = message.format_message()
 
         assert "New Quote Request #test-123" in formatted
@@ -312,7 +323,7 @@ class TestTelegramMessage:
             "total_cost": 22.50,
         }
 
-        message = TelegramMessage(**data)
+        message = TelegramMessage.model_validate(data)
         formatted = message.format_message()
 
         assert "New Quote Request #test-456" in formatted
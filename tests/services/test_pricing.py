@@ -1,12 +1,11 @@
 """Unit tests for pricing service."""
 
 import asyncio
-import os
-import tempfile
+
+import pytest
 
 from orca_quote_machine._rust_core import (
     CostBreakdown,
-    SlicingResult,
     parse_slicer_output,
 )
 from orca_quote_machine.models.quote import MaterialType
@@ -16,20 +15,21 @@ from orca_quote_machine.services.pricing import PricingService
 class TestPricingService:
     """Tests for the PricingService class."""
 
-    def test_calculate_quote(self):
+    @pytest.fixture(scope="class")
+    def sample_gcode_dir(self, tmp_path_factory: pytest.TempPathFactory) -> str:
+        """Sliced G-code output shared by every test in the class."""
+        gcode_dir = tmp_path_factory.mktemp("gcode")
+        (gcode_dir / "test.gcode").write_text(
+            "; estimated printing time: 2h 0m\n; filament used: 100.0g\n"
+        )
+        return str(gcode_dir)
+
+    def test_calculate_quote(self, sample_gcode_dir: str):
         """Test that calculate_quote returns correct structure and applies business logic."""
         service = PricingService()
 
         # Create a real slicing result using the Rust parser
-        async def create_slicing_result() -> SlicingResult:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                gcode_file = os.path.join(temp_dir, 'test.gcode')
-                with open(gcode_file, 'w') as f:  # noqa: ASYNC230  # Test file creation
-                    f.write('; estimated printing time: 2h 0m\n; filament used: 100.0g\n')
-
-                return await parse_slicer_output(temp_dir)
-
-        slicing_result = asyncio.run(create_slicing_result())
+        slicing_result = asyncio.run(parse_slicer_output(sample_gcode_dir))
         result = service.calculate_quote(slicing_result, MaterialType.PLA)
 
         # Test structure
@@ -42,20 +42,12 @@ class TestPricingService:
         assert result.total_cost >= 5.0  # Minimum price
         assert result.total_cost > 0
 
-    def test_format_cost_summary(self):
+    def test_format_cost_summary(self, sample_gcode_dir: str):
         """Test that format_cost_summary returns a string."""
         service = PricingService()
 
         # Create a real CostBreakdown using the actual pricing logic
-        async def create_slicing_result() -> SlicingResult:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                gcode_file = os.path.join(temp_dir, 'test.gcode')
-                with open(gcode_file, 'w') as f:  # noqa: ASYNC230  # Test file creation
-                    f.write('; estimated printing time: 2h 0m\n; filament used: 100.0g\n')
-
-                return await parse_slicer_output(temp_dir)
-
-        slicing_result = asyncio.run(create_slicing_result())
+        slicing_result = asyncio.run(parse_slicer_output(sample_gcode_dir))
         cost_breakdown = service.calculate_quote(slicing_result, MaterialType.PLA)
 
         result = service.format_cost_summary(cost_breakdown)
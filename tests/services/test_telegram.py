@@ -1,10 +1,60 @@
 """Unit tests for telegram service."""
 
+import asyncio
+import contextlib
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 import pytest
 
+from orca_quote_machine.core.config import Settings
 from orca_quote_machine.models.quote import TelegramMessage
+from orca_quote_machine.services import telegram
 from orca_quote_machine.services.telegram import TelegramService
 
+# Minimal Bot API reply to sendMessage
+_SEND_MESSAGE_REPLY = (
+    b'{"ok":true,"result":{"message_id":1,"date":0,'
+    b'"chat":{"id":42,"type":"private"}}}'
+)
+
+
+class _SlowBotApi:
+    """Stub Bot API that answers after a delay and records peak concurrency."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.handlers: set[asyncio.Task[None]] = set()
+
+    async def __call__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.handlers.add(asyncio.current_task())  # type: ignore[arg-type]
+        with contextlib.suppress(asyncio.IncompleteReadError, ConnectionError):
+            # Serve keep-alive requests until the client hangs up
+            while headers := await reader.readuntil(b"\r\n\r\n"):
+                length = next(
+                    int(line.split(b":", 1)[1])
+                    for line in headers.lower().split(b"\r\n")
+                    if line.startswith(b"content-length:")
+                )
+                await reader.readexactly(length)
+
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                await asyncio.sleep(0.3)
+                self.in_flight -= 1
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s"
+                    % (len(_SEND_MESSAGE_REPLY), _SEND_MESSAGE_REPLY)
+                )
+                await writer.drain()
+        writer.close()
+
 
 class TestTelegramService:
     """Tests for the TelegramService class."""
@@ -17,6 +67,20 @@ class TestTelegramService:
         assert hasattr(service, "settings")
         assert hasattr(service, "bot")
 
+    def test_services_share_bot_for_same_token(self):
+        """Test that services configured with one token reuse a single Bot."""
+        settings = Settings(
+            secret_key="test-secret-key",
+            telegram_bot_token="123456:TEST",
+            _env_file=None,
+        )
+
+        first = TelegramService(settings=settings)
+        second = TelegramService(settings=settings)
+
+        assert first.bot is not None
+        assert first.bot is second.bot
+
     @pytest.mark.asyncio
     async def test_send_quote_notification(self):
         """Test send_quote_notification returns boolean."""
@@ -55,3 +119,56 @@ class TestTelegramService:
         result = await service.test_connection()
 
         assert isinstance(result, bool)
+
+    @pytest.mark.asyncio
+    async def test_send_failures_return_false(self):
+        """Test that HTTP and unexpected errors are reported as a failed send."""
+        settings = Settings(
+            secret_key="test-secret-key",
+            telegram_bot_token="123456:TEST",
+            telegram_admin_chat_id="42",
+            _env_file=None,
+        )
+        service = TelegramService(settings=settings)
+        service.bot = MagicMock()
+        service.bot.send_message = AsyncMock(side_effect=httpx.ConnectError("down"))
+        service.bot.get_me = AsyncMock(side_effect=RuntimeError("boom"))
+
+        assert await service.send_error_notification("Test error", "test-123") is False
+        assert await service.test_connection() is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_run_in_parallel(self):
+        """Test that overlapping notifications each get a pooled connection."""
+        bot_api = _SlowBotApi()
+        server = await asyncio.start_server(bot_api, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        settings = Settings(
+            secret_key="test-secret-key",
+            telegram_bot_token="123456:TEST",
+            telegram_admin_chat_id="42",
+            _env_file=None,
+        )
+        local_bot = partial(telegram.Bot, base_url=f"http://127.0.0.1:{port}/bot")
+
+        async with server:
+            # Build an uncached bot with the production pool, aimed at the stub
+            with patch.object(telegram, "Bot", local_bot):
+                bot = telegram._get_bot.__wrapped__(settings.telegram_bot_token)
+            service = TelegramService(settings=settings)
+            service.bot = bot
+
+            results = await asyncio.gather(
+                *(
+                    service.send_error_notification("Test error", f"test-{i}")
+                    for i in range(6)
+                )
+            )
+            # Bot.shutdown() is a no-op for a bot that was never initialized
+            await bot.request.shutdown()
+            # Closed connections end the stub handlers; wait for them to return
+            await asyncio.wait(bot_api.handlers, timeout=1)
+
+        assert results == [True] * 6
+        # A single-connection pool would have queued them one at a time
+        assert bot_api.peak_in_flight == 6
@@ -39,6 +39,17 @@ class TestCustomValidationLogic:
         # All should be normalized to lowercase with leading dots
         assert settings.allowed_extensions == [".3mf", ".gcode", ".step"]
 
+    def test_allowed_extensions_set_matches_normalized_list(self):
+        """Test that the membership set is built from the normalized extensions."""
+        settings = Settings(
+            secret_key="test-secret-key",
+            allowed_extensions=["STL", ".Obj"],
+            _env_file=None,
+        )
+
+        assert settings.allowed_extensions_set == frozenset({".stl", ".obj"})
+        assert settings.allowed_extensions_set is settings.allowed_extensions_set
+
     def test_slicer_profiles_auto_initialization(self):
         """Test our custom slicer profiles initialization logic."""
         settings = Settings(
@@ -86,6 +97,62 @@ class TestCustomValidationLogic:
         ):
             SlicerProfileSettings(base_dir=Path("definitely_nonexistent_directory"))
 
+    def test_profile_validation_accepts_existing_profiles(self, tmp_path: Path) -> None:
+        """Test that validation passes when every configured profile is present."""
+        defaults = SlicerProfileSettings.model_construct()
+        for profile_type, filename in [
+            ("machine", defaults.machine),
+            ("process", defaults.process),
+            ("filament", defaults.filament_pla),
+            ("filament", defaults.filament_petg),
+            ("filament", defaults.filament_asa),
+        ]:
+            (tmp_path / profile_type).mkdir(exist_ok=True)
+            (tmp_path / profile_type / filename).touch()
+
+        with patch.dict(os.environ, {}, clear=True):
+            slicer_settings = SlicerProfileSettings(base_dir=tmp_path)
+
+        assert slicer_settings.base_dir == tmp_path
+
+    def test_profile_validation_skips_unchanged_directories(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that revalidation is skipped until a profile directory changes."""
+        defaults = SlicerProfileSettings.model_construct()
+        for profile_type, filename in [
+            ("machine", defaults.machine),
+            ("process", defaults.process),
+            ("filament", defaults.filament_pla),
+            ("filament", defaults.filament_petg),
+            ("filament", defaults.filament_asa),
+        ]:
+            (tmp_path / profile_type).mkdir(exist_ok=True)
+            (tmp_path / profile_type / filename).touch()
+
+        with patch.dict(os.environ, {}, clear=True):
+            SlicerProfileSettings(base_dir=tmp_path)
+            with patch("orca_quote_machine.core.config.os.scandir") as mock_scandir:
+                SlicerProfileSettings(base_dir=tmp_path)
+            mock_scandir.assert_not_called()
+
+            (tmp_path / "filament" / defaults.filament_asa).unlink()
+            with pytest.raises(ValueError, match="Filament profile not found at"):
+                SlicerProfileSettings(base_dir=tmp_path)
+
+    def test_profile_validation_reports_missing_profile_file(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that a missing file in an existing profile directory is reported."""
+        for profile_type in ("machine", "process", "filament"):
+            (tmp_path / profile_type).mkdir()
+
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            pytest.raises(ValueError, match="Machine profile not found at"),
+        ):
+            SlicerProfileSettings(base_dir=tmp_path)
+
 
 class TestConfigurationBehavior:
     """Tests for configuration behavior and integration logic."""
@@ -0,0 +1,31 @@
+"""Unit tests for FastAPI dependency providers."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from orca_quote_machine.core.config import get_settings
+from orca_quote_machine.dependencies import get_slicer_service
+from orca_quote_machine.services.slicer import OrcaSlicerService
+
+
+class TestSlicerServiceDependency:
+    """Tests for the shared slicer service provider."""
+
+    def test_reuses_lifespan_instance(self) -> None:
+        """Test that the instance created at startup is returned."""
+        slicer_service = OrcaSlicerService()
+        request = MagicMock()
+        request.app.state = SimpleNamespace(slicer=slicer_service)
+
+        assert get_slicer_service(request, get_settings()) is slicer_service
+
+    def test_creates_instance_once_without_lifespan(self) -> None:
+        """Test that a missing instance is created once and then reused."""
+        request = MagicMock()
+        request.app.state = SimpleNamespace()
+
+        first = get_slicer_service(request, get_settings())
+        second = get_slicer_service(request, get_settings())
+
+        assert isinstance(first, OrcaSlicerService)
+        assert first is second
@@ -16,14 +16,11 @@ from orca_quote_machine.tasks import (
 class TestTasks:
     """Tests for Celery task functions."""
 
-    @patch("orca_quote_machine.tasks.asyncio.run")
+    @patch("orca_quote_machine.tasks._run_async")
     @patch("orca_quote_machine.tasks.validate_3d_model", None)
-    @patch("orca_quote_machine.tasks.os.path.exists", return_value=False)
-    def test_process_quote_request(
-        self, mock_exists: MagicMock, mock_asyncio_run: MagicMock
-    ) -> None:
+    def test_process_quote_request(self, mock_run_async: MagicMock) -> None:
         """Test process_quote_request task function."""
-        mock_asyncio_run.return_value = {"success": True, "total_cost": 25.50}
+        mock_run_async.return_value = {"success": True, "total_cost": 25.50}
 
         quote_data = {
             "name": "John Doe",
@@ -106,6 +103,7 @@ class TestTasks:
         mock_stats = MagicMock()
         mock_stats.files_cleaned = 5
         mock_stats.bytes_freed = 12345
+        mock_stats.files_failed = 0
         mock_cleanup_rust.return_value = mock_stats
 
         result = cleanup_old_files(max_age_hours=24)
@@ -114,3 +112,4 @@ class TestTasks:
         assert "success" in result
         assert result["files_cleaned"] == 5
         assert result["bytes_freed"] == 12345
+        assert result["success"] is True
@@ -3,11 +3,17 @@
 Focus: Test request validation logic, file handling logic, and response formatting.
 """
 
-from unittest.mock import MagicMock, patch
+import errno
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from starlette.types import Message
 
+from orca_quote_machine import main
 from orca_quote_machine._rust_core import secure_filename
 from orca_quote_machine.main import app
 
@@ -32,16 +38,43 @@ class TestSecureFilenameIntegration:
 
         assert "my_model_v2.stl" in result
 
+    @pytest.mark.skipif(
+        sys.platform == "win32", reason="sanitize-filename adds Windows-only rules"
+    )
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            # Plain ASCII names skip the sanitizer and come back unchanged
+            ("model.stl", "model.stl"),
+            ("My Part_v2-final.STL", "My Part_v2-final.STL"),
+            (".hidden.stl", ".hidden.stl"),
+            ("CON.stl", "CON.stl"),
+            ("nul", "nul"),
+            # Anything else goes through sanitize-filename
+            ("../../etc/passwd", "....etcpasswd"),
+            ("..\\..\\model.stl", "....model.stl"),
+            ("a:b*c?.stl", "abc.stl"),
+            ("tab\tname.stl", "tabname.stl"),
+            ("modèle.stl", "modèle.stl"),
+            ("..", ""),
+            ("...", ""),
+            ("a" * 300, "a" * 255),
+        ],
+    )
+    def test_secure_filename_matches_sanitizer(self, filename: str, expected: str):
+        """Test fast-path and sanitized names against sanitize-filename's rules."""
+        assert secure_filename(filename) == expected
+
 
 class TestQuoteEndpointLogic:
     """Test the quote endpoint validation and processing logic."""
 
     @pytest.fixture
-    def client(self):
+    def client(self) -> TestClient:
         """Create test client."""
         return TestClient(app)
 
-    def test_quote_validates_file_extension(self, client):
+    def test_quote_validates_file_extension(self, client: TestClient):
         """Test that only allowed file extensions are accepted."""
         # Create a file with invalid extension
         files = {"model_file": ("test.txt", b"content", "text/plain")}
@@ -57,7 +90,22 @@ class TestQuoteEndpointLogic:
         assert response.status_code == 400
         assert "not allowed" in response.json()["detail"]
 
-    def test_quote_validates_material_exists(self, client):
+    def test_quote_rejects_dotfile_without_extension(self, client: TestClient):
+        """Test that a bare dotfile name is not treated as an extension."""
+        files = {"model_file": (".stl", b"content", "application/octet-stream")}
+        data = {
+            "name": "Test User",
+            "mobile": "+1234567890",
+            "material": "PLA",
+            "color": "Blue"
+        }
+
+        response = client.post("/quote", files=files, data=data)
+
+        assert response.status_code == 400
+        assert "not allowed" in response.json()["detail"]
+
+    def test_quote_validates_material_exists(self, client: TestClient):
         """Test material validation against available materials."""
         files = {"model_file": ("test.stl", b"content", "application/octet-stream")}
         data = {
@@ -77,7 +125,7 @@ class TestQuoteEndpointLogic:
             assert response.status_code == 400
             assert "Invalid material" in response.json()["detail"]
 
-    def test_quote_accepts_custom_materials(self, client):
+    def test_quote_accepts_custom_materials(self, client: TestClient):
         """Test that custom materials discovered by slicer are accepted."""
         files = {"model_file": ("test.stl", b"content", "application/octet-stream")}
         data = {
@@ -102,7 +150,28 @@ class TestQuoteEndpointLogic:
                 assert response.status_code == 202
                 assert response.json()["material"] == "TPU"
 
-    def test_quote_applies_secure_filename(self, client):
+    def test_quote_skips_profile_lookup_for_official_materials(self, client: TestClient):
+        """Test that enum materials are accepted without scanning profiles."""
+        files = {"model_file": ("test.stl", b"content", "application/octet-stream")}
+        data = {
+            "name": "Test User",
+            "mobile": "+1234567890",
+            "material": "petg",
+            "color": "Black"
+        }
+
+        with (
+            patch('orca_quote_machine.services.slicer.OrcaSlicerService.get_available_materials') as mock_materials,
+            patch('orca_quote_machine.main.process_quote_request.delay') as mock_task,
+        ):
+            mock_task.return_value = MagicMock(id="test-task-id")
+
+            response = client.post("/quote", files=files, data=data)
+
+            assert response.status_code == 202
+            mock_materials.assert_not_called()
+
+    def test_quote_applies_secure_filename(self, client: TestClient):
         """Test that uploaded filenames are sanitized."""
         # Filename with path traversal attempt
         dangerous_filename = "../../../etc/passwd"
@@ -129,11 +198,11 @@ class TestHomeEndpointLogic:
     """Test the home endpoint template data logic."""
 
     @pytest.fixture
-    def client(self):
+    def client(self) -> TestClient:
         """Create test client."""
         return TestClient(app)
 
-    def test_home_includes_available_materials(self, client):
+    def test_home_includes_available_materials(self, client: TestClient):
         """Test that home page gets materials from slicer service."""
         with patch('orca_quote_machine.main.OrcaSlicerService') as mock_slicer:
             mock_instance = mock_slicer.return_value
@@ -144,7 +213,7 @@ class TestHomeEndpointLogic:
             assert response.status_code == 200
             # Materials should be passed to template
 
-    def test_home_fallback_on_slicer_error(self, client):
+    def test_home_fallback_on_slicer_error(self, client: TestClient):
         """Test that home page falls back to enum values on error."""
         with patch('orca_quote_machine.main.OrcaSlicerService') as mock_slicer:
             mock_instance = mock_slicer.return_value
@@ -156,15 +225,141 @@ class TestHomeEndpointLogic:
             # Should still work with fallback materials
 
 
+class TestUploadCopyLogic:
+    """Test the upload save helper."""
+
+    def test_save_upload_copies_disk_backed_spool(self, tmp_path: Path):
+        """Test that an upload spooled to disk is copied in full."""
+        dest = tmp_path / "model.stl"
+        with tempfile.SpooledTemporaryFile(max_size=1024) as upload:
+            upload.write(b"x" * 4096)
+
+            written = main._save_upload(upload, dest, 10_000)
+
+        assert written == 4096
+        assert dest.read_bytes() == b"x" * 4096
+
+    def test_save_upload_copies_in_memory_spool(self, tmp_path: Path):
+        """Test that an upload still held in memory is copied in full."""
+        dest = tmp_path / "model.stl"
+        with tempfile.SpooledTemporaryFile(max_size=1024) as upload:
+            upload.write(b"solid test")
+
+            written = main._save_upload(upload, dest, 10_000)
+
+        assert written == 10
+        assert dest.read_bytes() == b"solid test"
+
+    def test_save_upload_stops_past_limit(self, tmp_path: Path):
+        """Test that copying stops one byte past the size limit."""
+        dest = tmp_path / "model.stl"
+        with tempfile.SpooledTemporaryFile(max_size=1024) as upload:
+            upload.write(b"x" * 4096)
+
+            written = main._save_upload(upload, dest, 1024)
+
+        assert written == 1025
+        assert dest.stat().st_size == 1025
+
+    def test_save_upload_falls_back_when_sendfile_fails(self, tmp_path: Path):
+        """Test that a sendfile error falls back to the buffered copy."""
+        dest = tmp_path / "model.stl"
+        with (
+            tempfile.SpooledTemporaryFile(max_size=1024) as upload,
+            patch.object(main, "_SENDFILE_FILE_TO_FILE", True),
+            patch.object(
+                main.os, "sendfile", side_effect=OSError(errno.EINVAL, "Invalid argument")
+            ) as mock_sendfile,
+        ):
+            upload.write(b"x" * 4096)
+
+            written = main._save_upload(upload, dest, 2048)
+
+        mock_sendfile.assert_called_once()
+        assert written == 2049
+        assert dest.read_bytes() == b"x" * 2049
+
+    def test_save_upload_skips_sendfile_off_linux(self, tmp_path: Path):
+        """Test that platforms without file-to-file sendfile copy in buffers."""
+        dest = tmp_path / "model.stl"
+        with (
+            tempfile.SpooledTemporaryFile(max_size=1024) as upload,
+            patch.object(main, "_SENDFILE_FILE_TO_FILE", False),
+            patch.object(main.os, "sendfile", create=True) as mock_sendfile,
+        ):
+            upload.write(b"x" * 4096)
+
+            written = main._save_upload(upload, dest, 10_000)
+
+        mock_sendfile.assert_not_called()
+        assert written == 4096
+        assert dest.read_bytes() == b"x" * 4096
+
+    @pytest.mark.asyncio
+    async def test_safe_unlink_ignores_missing_file(self, tmp_path: Path):
+        """Test that cleanup removes the file and tolerates it being gone."""
+        dest = tmp_path / "model.stl"
+        dest.write_bytes(b"solid test")
+
+        await main._safe_unlink(dest)
+        await main._safe_unlink(dest)
+
+        assert not dest.exists()
+
+
+class TestUploadSizeLimitLogic:
+    """Test the Content-Length preflight for quote uploads."""
+
+    @staticmethod
+    async def _call(
+        content_length: bytes, path: str = "/quote"
+    ) -> tuple[AsyncMock, list[Message]]:
+        inner = AsyncMock()
+        middleware = main.UploadSizeLimitMiddleware(
+            inner, path="/quote", max_body_size=1024
+        )
+        sent: list[Message] = []
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": path,
+            "headers": [(b"content-length", content_length)],
+        }
+        await middleware(scope, AsyncMock(), send)
+        return inner, sent
+
+    @pytest.mark.asyncio
+    async def test_rejects_declared_oversize_upload(self):
+        """Test that an oversize upload is refused before the app reads it."""
+        inner, sent = await self._call(b"2048")
+
+        inner.assert_not_called()
+        assert sent[0]["status"] == 413
+
+    @pytest.mark.asyncio
+    async def test_passes_uploads_within_limit_and_other_paths(self):
+        """Test that small uploads and other routes reach the app."""
+        inner, sent = await self._call(b"512")
+        inner.assert_awaited_once()
+
+        inner, sent = await self._call(b"2048", path="/status/abc")
+        inner.assert_awaited_once()
+        assert sent == []
+
+
 class TestTaskStatusLogic:
     """Test task status endpoint logic."""
 
     @pytest.fixture
-    def client(self):
+    def client(self) -> TestClient:
         """Create test client."""
         return TestClient(app)
 
-    def test_status_formats_pending_correctly(self, client):
+    def test_status_formats_pending_correctly(self, client: TestClient):
         """Test pending task status formatting."""
         with patch('orca_quote_machine.main.celery_app.AsyncResult') as mock_result:
             mock_result.return_value.state = "PENDING"
@@ -175,7 +370,7 @@ class TestTaskStatusLogic:
             assert response.json()["status"] == "processing"
             assert response.json()["task_id"] == "test-task-id"
 
-    def test_status_includes_result_on_success(self, client):
+    def test_status_includes_result_on_success(self, client: TestClient):
         """Test successful task includes result data."""
         with patch('orca_quote_machine.main.celery_app.AsyncResult') as mock_result:
             mock_async = mock_result.return_value
@@ -7,7 +7,7 @@ import asyncio
 import os
 import tempfile
 
-from orca_quote_machine._rust_core import parse_slicer_output
+from orca_quote_machine._rust_core import calculate_quote_rust, parse_slicer_output
 from orca_quote_machine.models.quote import MaterialType
 from orca_quote_machine.services.pricing import PricingService
 
@@ -80,6 +80,19 @@ class TestPricingServiceLogic:
 
         assert result.material_type == "PLA"
 
+    def test_calculate_quote_reuses_result_for_identical_inputs(self):
+        """Test that repeat quotes for the same job are served from the cache."""
+        service = PricingService()
+
+        slicing_result = asyncio.run(self.create_test_slicing_result())
+
+        first = service.calculate_quote(slicing_result, MaterialType.PLA)
+        second = service.calculate_quote(slicing_result, MaterialType.PLA)
+        other_material = service.calculate_quote(slicing_result, MaterialType.PETG)
+
+        assert first is second
+        assert other_material is not first
+
     def test_format_cost_summary_returns_string(self):
         """Test that format_cost_summary returns formatted string."""
         service = PricingService()
@@ -96,3 +109,30 @@ class TestPricingServiceLogic:
         assert "Material:" in result
         assert "Time:" in result
         assert "Total:" in result
+
+    def test_format_cost_summary_exact_text(self):
+        """Test the summary text, unchanged from the former Python f-string."""
+        service = PricingService()
+        cost_breakdown = calculate_quote_rust(120, 100.0, "PLA", 25.0, 0.5, 1.1, 5.0)
+
+        assert service.format_cost_summary(cost_breakdown) == (
+            "Cost Breakdown:\n"
+            "Material: 100.0g (0.100kg) × S$25.00/kg = S$2.50\n"
+            "Time: 2.5h × S$25.00/h = S$62.50\n"
+            "Subtotal: S$71.50 (includes 10% markup)\n"
+            "Total: S$71.50\n"
+        )
+
+    def test_format_cost_summary_marks_minimum_price(self):
+        """Test that a minimum-price total is starred and explained."""
+        service = PricingService()
+        cost_breakdown = calculate_quote_rust(6, 2.0, "PLA", 1.0, 0.0, 1.0, 5.0)
+
+        assert service.format_cost_summary(cost_breakdown) == (
+            "Cost Breakdown:\n"
+            "Material: 2.0g (0.002kg) × S$1.00/kg = S$0.00\n"
+            "Time: 0.1h × S$1.00/h = S$0.10\n"
+            "Subtotal: S$0.10 (includes 0% markup)\n"
+            "Total: S$5.00*\n"
+            "* Minimum price applied"
+        )
@@ -3,11 +3,14 @@
 Focus: Test profile resolution logic, material discovery, and error handling.
 """
 
+import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from orca_quote_machine._rust_core import parse_slicer_output
+from orca_quote_machine.core.config import Settings
 from orca_quote_machine.models.quote import MaterialType
 from orca_quote_machine.services.slicer import OrcaSlicerService, SlicerError
 
@@ -47,6 +50,49 @@ class TestSlicerServiceLogic:
         assert "filament" in paths
         # Should use PLA profile
 
+    def test_get_profile_paths_resolves_material_once(self):
+        """Test that repeated lookups for a material reuse the resolved paths."""
+        service = OrcaSlicerService()
+
+        first = service.get_profile_paths("PETG")
+        with patch.object(service, "_get_filament_profile_path") as mock_lookup:
+            second = service.get_profile_paths(MaterialType.PETG)
+
+        mock_lookup.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_slicer_profile_args_are_built_once(self):
+        """Test that the CLI profile arguments are joined once per material."""
+        service = OrcaSlicerService()
+        paths = service.get_profile_paths(MaterialType.PETG)
+
+        first = service._get_slicer_profile_args(MaterialType.PETG)
+        with patch.object(service, "get_profile_paths") as mock_paths:
+            second = service._get_slicer_profile_args(MaterialType.PETG)
+
+        mock_paths.assert_not_called()
+        assert first == (f"{paths['machine']};{paths['process']}", paths["filament"])
+        assert second is first
+
+    def test_profile_caches_drop_removed_profiles(self, tmp_path: Path):
+        """Test that a deleted custom profile is not served from the caches."""
+        service = OrcaSlicerService()
+        service.filament_profiles_dir = tmp_path
+        (tmp_path / "tpu.json").touch()
+
+        assert service._get_slicer_profile_args("TPU")[1].endswith("tpu.json")
+
+        # Removing a profile bumps the directory mtime
+        (tmp_path / "tpu.json").unlink()
+        mtime_ns = tmp_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+
+        with pytest.raises(SlicerError, match="No profile found"):
+            service._get_slicer_profile_args("TPU")
+        with pytest.raises(SlicerError, match="No profile found"):
+            service.get_profile_paths("TPU")
+
     def test_get_available_materials_returns_list(self):
         """Test material discovery returns a list of strings."""
         service = OrcaSlicerService()
@@ -60,26 +106,43 @@ class TestSlicerServiceLogic:
         assert "PETG" in materials
         assert "ASA" in materials
 
-    def test_get_available_materials_includes_custom(self):
+    def test_get_available_materials_includes_custom(self, tmp_path: Path):
         """Test that custom materials are discovered from filesystem."""
         service = OrcaSlicerService()
+        service.filament_profiles_dir = tmp_path
+
+        for name in ("TPU.json", "nylon.json", "PLA.json", "notes.txt"):
+            (tmp_path / name).touch()
+        (tmp_path / "archive.json").mkdir()
+
+        materials = service.get_available_materials()
+
+        # Should include both enum and custom materials
+        assert "TPU" in materials
+        assert "NYLON" in materials
+        # Should not have duplicates
+        assert materials.count("PLA") == 1
+        # Non-profile entries are ignored
+        assert "NOTES" not in materials
+        assert "ARCHIVE" not in materials
+
+    def test_get_available_materials_rescans_only_when_profiles_change(self, tmp_path: Path):
+        """Test that the profile directory is rescanned only after its mtime changes."""
+        service = OrcaSlicerService()
+        service.filament_profiles_dir = tmp_path
+        (tmp_path / "TPU.json").touch()
 
-        # Mock the filament directory to include custom materials
-        with patch.object(Path, 'glob') as mock_glob:
-            mock_files = [
-                MagicMock(stem="TPU"),
-                MagicMock(stem="NYLON"),
-                MagicMock(stem="PLA"),  # Duplicate of enum
-            ]
-            mock_glob.return_value = mock_files
+        first = service.get_available_materials()
+        with patch("orca_quote_machine.services.slicer.os.scandir") as mock_scandir:
+            assert service.get_available_materials() == first
+        mock_scandir.assert_not_called()
 
-            materials = service.get_available_materials()
+        # Adding a profile bumps the directory mtime
+        (tmp_path / "NYLON.json").touch()
+        mtime_ns = tmp_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
 
-            # Should include both enum and custom materials
-            assert "TPU" in materials
-            assert "NYLON" in materials
-            # Should not have duplicates
-            assert materials.count("PLA") == 1
+        assert "NYLON" in service.get_available_materials()
 
     def test_get_filament_profile_path_with_override(self):
         """Test filament profile resolution with config override."""
@@ -127,3 +190,65 @@ class TestSlicerServiceLogic:
             await service.slice_model("/nonexistent/file.stl", MaterialType.PLA)
 
         assert "Model file not found" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_slice_model_reports_slicer_stderr(self, tmp_path: Path):
+        """Test that a failing slicer's stderr ends up in the error."""
+        cli = tmp_path / "orca-slicer"
+        cli.write_text("#!/bin/sh\necho 'bad profile' >&2\nexit 1\n")
+        cli.chmod(0o755)
+        model = tmp_path / "model.stl"
+        model.write_bytes(b"solid test")
+
+        # Fresh settings keep this independent of the shared cached instance
+        service = OrcaSlicerService(
+            settings=Settings(secret_key="test-secret-key", _env_file=None)
+        )
+        service.cli_path = str(cli)
+
+        with pytest.raises(SlicerError, match="bad profile"):
+            await service.slice_model(str(model), MaterialType.PLA)
+
+
+class TestSlicerOutputParsing:
+    """Tests for metadata extraction from sliced G-code."""
+
+    @pytest.mark.asyncio
+    async def test_parse_reads_footer_totals(self, tmp_path: Path):
+        """Test that totals written only after the moves are found."""
+        moves = "G1 X10.000 Y10.000 E0.05000\n" * 4000
+        footer = (
+            "; filament used [mm] = 1150.42\n"
+            "; filament used [cm3] = 2.77\n"
+            "; filament used [g] = 3.45\n"
+            "; filament cost = 0.08\n"
+            "; total filament used [g] = 3.45\n"
+            "; total layers count = 54\n"
+            "; estimated printing time (normal mode) = 1h 2m 3s\n"
+        )
+        # Moves alone overrun the 64 KiB head that is scanned first
+        assert len(moves) > 64 * 1024
+        (tmp_path / "model.gcode").write_text(moves + footer)
+
+        result = await parse_slicer_output(str(tmp_path))
+
+        assert result.print_time_minutes == 62
+        assert result.filament_weight_grams == pytest.approx(3.45)
+        assert result.layer_count == 54
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("time_text", "minutes"),
+        [("1h 30m", 90), ("90", 90), ("0", 60), ("", 60)],
+    )
+    async def test_parse_print_time_formats(
+        self, tmp_path: Path, time_text: str, minutes: int
+    ):
+        """Test print time parsing; unparseable times fall back to one hour."""
+        (tmp_path / "model.gcode").write_text(
+            f"; estimated printing time: {time_text}\n"
+        )
+
+        result = await parse_slicer_output(str(tmp_path))
+
+        assert result.print_time_minutes == minutes
@@ -3,12 +3,15 @@
 Focus: Test task orchestration logic, error handling, and cleanup behavior.
 """
 
+import asyncio
 import os
 import tempfile
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from orca_quote_machine._rust_core import CostBreakdown, SlicingResult
 from orca_quote_machine.tasks import cleanup_old_files, process_quote_request
 
 
@@ -39,7 +42,7 @@ class TestProcessQuoteRequestLogic:
 
     @patch('orca_quote_machine.tasks.validate_3d_model')
     def test_task_handles_unknown_material(self, mock_validate):
-        """Test that unknown materials default to PLA."""
+        """Test that non-enum materials are passed on by name."""
         mock_result = MagicMock()
         mock_result.file_type = "stl"
         mock_result.file_size = 100
@@ -48,7 +51,7 @@ class TestProcessQuoteRequestLogic:
         mock_validate.return_value = mock_result
 
         # Mock the async pipeline
-        with patch('orca_quote_machine.tasks.asyncio.run') as mock_run:
+        with patch('orca_quote_machine.tasks._run_async') as mock_run:
             mock_run.return_value = {
                 "success": True,
                 "quote_id": "test-id",
@@ -60,10 +63,10 @@ class TestProcessQuoteRequestLogic:
                 result = process_quote_request(
                     temp_file.name,
                     {"name": "Test", "mobile": "123"},
-                    "UNKNOWN_MATERIAL"  # Invalid material
+                    "unknown_material"  # Not an enum member
                 )
 
-                # Should complete successfully with PLA default
+                # The slicer decides whether a profile exists for the name
                 assert result["success"] is True
 
     def test_task_cleans_up_file_on_success(self):
@@ -82,7 +85,7 @@ class TestProcessQuoteRequestLogic:
             mock_result.error_message = None
             mock_validate.return_value = mock_result
 
-            with patch('orca_quote_machine.tasks.asyncio.run') as mock_run:
+            with patch('orca_quote_machine.tasks._run_async') as mock_run:
                 mock_run.return_value = {
                     "success": True,
                     "quote_id": "test-id",
@@ -120,6 +123,99 @@ class TestProcessQuoteRequestLogic:
             # File should still be cleaned up
             assert not os.path.exists(temp_path)
 
+    def test_task_result_survives_failed_cleanup(self):
+        """Test that an undeletable upload does not turn success into an error."""
+        with (
+            patch('orca_quote_machine.tasks.validate_3d_model') as mock_validate,
+            patch(
+                'orca_quote_machine.tasks._run_async',
+                return_value={"success": True},
+            ),
+            patch(
+                'orca_quote_machine.tasks.os.unlink',
+                side_effect=PermissionError("read-only"),
+            ),
+        ):
+            mock_validate.return_value = MagicMock(is_valid=True)
+
+            result = process_quote_request(
+                "/uploads/model.stl",
+                {"name": "Test", "mobile": "123"},
+                "PLA"
+            )
+
+        assert result == {"success": True}
+
+    def test_task_slices_and_prices_custom_material_by_name(self, tmp_path: Path):
+        """Test that a custom material uses its own profile and the default price."""
+        from orca_quote_machine._rust_core import calculate_quote_rust
+        from orca_quote_machine.core.config import Settings, get_settings
+        from orca_quote_machine.services.slicer import OrcaSlicerService
+
+        # Stand-in CLI: records its arguments and writes one sliced file
+        args_file = tmp_path / "args.txt"
+        cli = tmp_path / "orca-slicer"
+        cli.write_text(
+            "#!/bin/sh\n"
+            f'printf "%s\\n" "$@" > "{args_file}"\n'
+            'while [ $# -gt 0 ]; do [ "$1" = --outputdir ] && out="$2"; shift; done\n'
+            'mkdir -p "$out"\n'
+            "printf '; estimated printing time: 2h 0m\\n; filament used: 50.0g\\n'"
+            ' > "$out/model.gcode"\n'
+        )
+        cli.chmod(0o755)
+        filament_dir = tmp_path / "filament"
+        filament_dir.mkdir()
+        tpu_profile = filament_dir / "tpu.json"
+        tpu_profile.write_text("{}")
+        model_path = tmp_path / "model.stl"
+        model_path.write_bytes(b"solid test")
+
+        # Fresh settings keep this independent of the shared cached instance
+        slicer_service = OrcaSlicerService(
+            settings=Settings(secret_key="test-secret-key", _env_file=None)
+        )
+        slicer_service.cli_path = str(cli)
+        slicer_service.filament_profiles_dir = filament_dir
+        telegram_service = MagicMock()
+        telegram_service.send_quote_notification = AsyncMock(return_value=True)
+
+        with (
+            patch('orca_quote_machine.tasks.validate_3d_model') as mock_validate,
+            patch(
+                'orca_quote_machine.tasks._get_slicer_service',
+                return_value=slicer_service,
+            ),
+            patch(
+                'orca_quote_machine.tasks._get_telegram_service',
+                return_value=telegram_service,
+            ),
+        ):
+            mock_validate.return_value = MagicMock(is_valid=True)
+
+            result = process_quote_request(
+                str(model_path),
+                {"name": "Test", "mobile": "123", "filename": "model.stl"},
+                "tpu",
+            )
+
+        assert result["success"] is True
+        cli_args = args_file.read_text().splitlines()
+        assert cli_args[cli_args.index("--load-filaments") + 1] == str(tpu_profile.resolve())
+
+        settings = get_settings()
+        expected = calculate_quote_rust(
+            120,
+            50.0,
+            "TPU",
+            settings.default_price_per_kg,
+            settings.additional_time_hours,
+            settings.price_multiplier,
+            settings.minimum_price,
+        )
+        assert result["cost_breakdown"]["material_type"] == "TPU"
+        assert result["cost_breakdown"]["total_cost"] == pytest.approx(expected.total_cost)
+
     @patch('orca_quote_machine.tasks.send_failure_notification')
     @patch('orca_quote_machine.tasks.validate_3d_model')
     def test_task_sends_error_notification(self, mock_validate, mock_notify):
@@ -137,11 +233,101 @@ class TestProcessQuoteRequestLogic:
             # Should attempt to send notification (even if it fails)
 
 
+class TestWorkerEventLoopLogic:
+    """Test the long-lived event loop shared by worker tasks."""
+
+    def test_run_async_reuses_one_loop(self):
+        """Test that successive coroutines run on the same background loop."""
+        from orca_quote_machine.tasks import _run_async
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = _run_async(current_loop())
+        second = _run_async(current_loop())
+
+        assert first is second
+        assert first.is_running()
+
+    def test_run_async_after_stop_starts_a_fresh_loop(self):
+        """Test that a stopped loop is closed and not reused."""
+        from orca_quote_machine.tasks import (
+            _get_event_loop,
+            _run_async,
+            _stop_event_loop,
+        )
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = _run_async(current_loop())
+        _stop_event_loop()
+        # Bounded wait, so reusing the stopped loop fails instead of hanging
+        second = asyncio.run_coroutine_threadsafe(
+            current_loop(), _get_event_loop()
+        ).result(timeout=5)
+
+        assert first.is_closed()
+        assert second is not first
+        assert second.is_running()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_forked_child_starts_its_own_loop(self):
+        """Test that a prefork child does not inherit the parent's loop."""
+        from orca_quote_machine import tasks
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        parent_loop = tasks._run_async(current_loop())
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                child_loop = asyncio.run_coroutine_threadsafe(
+                    current_loop(), tasks._get_event_loop()
+                ).result(timeout=5)
+                exit_code = 0 if child_loop is not parent_loop else 1
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+    def test_failure_notification_is_queued_in_background(self, tmp_path: Path):
+        """Test that a failed task returns without waiting on the admin alert."""
+        from orca_quote_machine.tasks import _run_async, _wait_for_background_tasks
+
+        model_path = tmp_path / "model.stl"
+        model_path.write_bytes(b"solid test")
+        telegram_service = MagicMock()
+        telegram_service.send_error_notification = AsyncMock(return_value=True)
+
+        with (
+            patch('orca_quote_machine.tasks.validate_3d_model') as mock_validate,
+            patch(
+                'orca_quote_machine.tasks._get_telegram_service',
+                return_value=telegram_service,
+            ),
+        ):
+            mock_validate.side_effect = Exception("Critical error")
+
+            result = process_quote_request(str(model_path), {}, "PLA")
+            _run_async(_wait_for_background_tasks())
+
+        assert result["success"] is False
+        assert not model_path.exists()
+        telegram_service.send_error_notification.assert_awaited_once()
+
+
 class TestRunProcessingPipelineLogic:
     """Test the async processing pipeline orchestration."""
 
     @pytest.mark.asyncio
-    async def test_pipeline_orchestrates_services(self, sample_slicing_result, sample_cost_breakdown):
+    async def test_pipeline_orchestrates_services(
+        self, sample_slicing_result: SlicingResult, sample_cost_breakdown: CostBreakdown
+    ):
         """Test that pipeline calls services in correct order."""
         from orca_quote_machine.tasks import run_processing_pipeline
 
@@ -169,12 +355,51 @@ class TestRunProcessingPipelineLogic:
                     )
 
                     assert result["success"] is True
-                    assert result["notification_sent"] is True
+                    assert result["notification_sent"] is False
+                    assert result["notification_queued"] is True
+
+                    # The notification runs in the background on the same loop
+                    await asyncio.sleep(0)
 
                     # Verify service call order
                     mock_slicer_instance.slice_model.assert_called_once()
                     mock_pricing_instance.calculate_quote.assert_called_once()
-                    mock_telegram_instance.send_quote_notification.assert_called_once()
+                    mock_telegram_instance.send_quote_notification.assert_awaited_once()
+
+                    # Notification shows print time and weight in display form
+                    message = mock_telegram_instance.send_quote_notification.call_args.args[0]
+                    minutes = sample_slicing_result.print_time_minutes
+                    assert message.print_time == f"{minutes // 60}h {minutes % 60}m"
+                    assert message.filament_weight == f"{sample_slicing_result.filament_weight_grams:.1f}g"
+
+    @pytest.mark.asyncio
+    async def test_pipeline_reuses_services_across_tasks(
+        self, sample_slicing_result: SlicingResult, sample_cost_breakdown: CostBreakdown
+    ):
+        """Test that slicer and pricing services are created once per worker."""
+        from orca_quote_machine.tasks import run_processing_pipeline
+
+        with (
+            patch('orca_quote_machine.tasks.OrcaSlicerService') as mock_slicer,
+            patch('orca_quote_machine.tasks.PricingService') as mock_pricing,
+            patch('orca_quote_machine.tasks.TelegramService') as mock_telegram,
+        ):
+            mock_slicer.return_value.slice_model = AsyncMock(return_value=sample_slicing_result)
+            mock_pricing.return_value.calculate_quote = MagicMock(return_value=sample_cost_breakdown)
+            mock_telegram.return_value.send_quote_notification = AsyncMock(return_value=True)
+
+            for quote_id in ("quote-1", "quote-2"):
+                await run_processing_pipeline(
+                    "/test/file.stl",
+                    {"name": "Test", "mobile": "123", "filename": "test.stl"},
+                    None,
+                    quote_id,
+                    quote_id,
+                )
+
+            mock_slicer.assert_called_once()
+            mock_pricing.assert_called_once()
+            assert mock_slicer.return_value.slice_model.call_count == 2
 
 
 class TestCleanupTaskLogic:
@@ -191,6 +416,22 @@ class TestCleanupTaskLogic:
         assert result["success"] is True
         assert result["files_cleaned"] == sample_cleanup_stats.files_cleaned
         assert result["bytes_freed"] == sample_cleanup_stats.bytes_freed
+        assert result["files_failed"] == 0
+
+    @patch('orca_quote_machine.tasks.cleanup_old_files_rust')
+    def test_cleanup_reports_files_it_could_not_remove(self, mock_cleanup):
+        """Test cleanup task surfaces files the Rust cleanup failed to remove."""
+        mock_cleanup.return_value = MagicMock(
+            files_cleaned=3, bytes_freed=300, files_failed=2
+        )
+
+        with patch("orca_quote_machine.tasks.logger") as mock_logger:
+            result = cleanup_old_files(max_age_hours=24)
+
+        assert result["success"] is False
+        assert result["files_cleaned"] == 3
+        assert result["files_failed"] == 2
+        mock_logger.warning.assert_called_once()
 
     @patch('orca_quote_machine.tasks.cleanup_old_files_rust')
     def test_cleanup_handles_rust_errors(self, mock_cleanup):